@@ -3,6 +3,10 @@ import { HttpClient, HttpParams } from '@angular/common/http';
 import { environment } from '../../../environment';
 import { catchError, delay, Observable, throwError } from 'rxjs';
 import { Event } from '../../interfaces/events.interface';
+import {
+  BatchRequest,
+  BatchResponse,
+} from '../../interfaces/batch.interface';
 
 @Injectable({
   providedIn: 'root',
@@ -19,6 +23,36 @@ export class EventService {
     );
   }
 
+  getEventsInRange(start: Date, end: Date): Observable<Event[]> {
+    return this.http
+      .get<Event[]>(`${environment.apiUrl}/events/range/`, {
+        params: new HttpParams()
+          .set('start', start.toISOString())
+          .set('end', end.toISOString()),
+      })
+      .pipe(
+        catchError((error: Error) =>
+          throwError(() => new Error('Events not found')),
+        ),
+      );
+  }
+
+  batch(
+    requests: BatchRequest[],
+    atomic = false,
+  ): Observable<BatchResponse[]> {
+    return this.http
+      .post<BatchResponse[]>(`${environment.apiUrl}/batch/`, {
+        requests,
+        atomic,
+      })
+      .pipe(
+        catchError((error: Error) =>
+          throwError(() => new Error('Batch request failed')),
+        ),
+      );
+  }
+
   getEvent(id: number, userId: number): Observable<Event> {
     if (!userId || !id) {
       return throwError(() => new Error('Missing user id or event id'));
@@ -0,0 +1,12 @@
+export interface BatchRequest {
+  method?: 'GET' | 'POST' | 'PUT' | 'PATCH' | 'DELETE';
+  path: string;
+  body?: unknown;
+  headers?: Record<string, string>;
+}
+
+export interface BatchResponse<T = unknown> {
+  status: number;
+  headers: Record<string, string>;
+  body: T;
+}
@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, Optional
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.auth.cache import user_cache
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` reading the user from the in-process
+    ``user_cache``, so a request with a known token runs no query.
+    The user checks run once, when the user is cached.
+    """
+
+    @staticmethod
+    def cache_key(validated_token: Token) -> tuple[str, Optional[str]]:
+        return (
+            str(validated_token[api_settings.USER_ID_CLAIM]),
+            validated_token.get(api_settings.JTI_CLAIM),
+        )
+
+    def get_user(self, validated_token: Token) -> "User":
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        user_id, jti = self.cache_key(validated_token)
+        user = user_cache.get(user_id, jti)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, jti, user)
+        return user
+
+
+class AsyncJWTAuthentication(CachedJWTAuthentication):
+    """
+    ``CachedJWTAuthentication`` for async views. Checking the token needs
+    no I/O, a user missing from the cache is fetched with the async ORM
+    so no thread is blocked.
+    """
+
+    async def aauthenticate(self, request) -> Optional[tuple["User", Token]]:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token: Token) -> "User":
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        cache_user_id, jti = self.cache_key(validated_token)
+        user = user_cache.get(cache_user_id, jti)
+        if user is not None:
+            return user
+
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False) and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+        user_cache.set(cache_user_id, jti, user)
+        return user
@@ -0,0 +1,41 @@
+import copy
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+
+from apps.common.cache import LRUCache
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+
+class UserCache:
+    """
+    Authenticated users keyed by (user id, token jti), so a request with a
+    known token skips the ``users`` query.
+
+    Entries are dropped when the user is updated or deleted through the
+    ``UserManager``. The ttl bounds how long changes made elsewhere
+    (admin, raw queries) go unnoticed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, user_id: str, jti: Optional[str]) -> Optional["User"]:
+        user = self.cache.get((user_id, jti))
+        # requests get their own copy, attributes set on one never leak
+        return copy.copy(user) if user is not None else None
+
+    def set(self, user_id: str, jti: Optional[str], user: "User") -> None:
+        self.cache.set((user_id, jti), copy.copy(user))
+
+    def invalidate_user(self, user_id: uuid.UUID | str) -> None:
+        user_id = str(user_id)
+        self.cache.delete_where(lambda key: key[0] == user_id)
+
+
+user_cache = UserCache(
+    maxsize=settings.AUTH["USER_CACHE_SIZE"], ttl=settings.AUTH["USER_CACHE_TTL"]
+)
@@ -1,6 +1,5 @@
 from typing import Optional
 
-from django.utils import timezone
 from rest_framework import serializers, status
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
@@ -27,6 +26,11 @@ class TokenSerializer(TokenObtainPairSerializer):
         access_token: AccessToken = cls.get_token(user).access_token  # type: ignore
         return access_token
 
+    @classmethod
+    def get_token_pair(cls, user: "User") -> tuple[RefreshToken, AccessToken]:
+        refresh_token: RefreshToken = cls.get_token(user)  # type: ignore
+        return refresh_token, refresh_token.access_token
+
     @classmethod
     def decode_token(
         cls, token: AccessToken | RefreshToken
@@ -100,31 +104,27 @@ class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField(write_only=True)
     password = serializers.CharField(write_only=True)
 
-    @staticmethod
-    def validate_email(email: str) -> str:
-        if not User.objects.get_user_by_email(email=email):
+    def validate(self, attrs):
+        # one query for the user, the password is checked on that instance
+        user = User.objects.get_user_by_email(email=attrs.get("email"))
+        if not user:
             raise serializers.ValidationError(
-                detail="User with this email does not exist",
+                detail={"email": ["User with this email does not exist"]},
                 code=status.HTTP_404_NOT_FOUND,
             )
-        return email
 
-    def validate(self, attrs):
-        email = attrs.get("email")
-        password = attrs.get("password")
-        user = User.auth.authenticate_user(email=email, password=password)
-        if not user:
+        if not (
+            User.auth.verify_password(user, attrs.get("password")) and user.is_active
+        ):
             raise serializers.ValidationError(
                 detail="Invalid credentials",
                 code=status.HTTP_400_BAD_REQUEST,
             )
 
-        user.last_login = timezone.now()
-        user.save(update_fields=["last_login"])
+        User.objects.update_last_login(user.id)
 
         attrs["user"] = user
-        attrs["access"] = TokenSerializer.get_access_token(user)
-        attrs["refresh"] = TokenSerializer.get_refresh_token(user)
+        attrs["refresh"], attrs["access"] = TokenSerializer.get_token_pair(user)
         return attrs
 
     def to_representation(self, instance):
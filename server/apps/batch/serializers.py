@@ -0,0 +1,22 @@
+from django.conf import settings
+from rest_framework import serializers
+
+METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+
+class BatchItemSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=METHODS, default="GET")
+    # relative to the API version, e.g. "events/2025/3/" or "events/range/?start=..."
+    path = serializers.CharField(max_length=2048)
+    body = serializers.JSONField(required=False, default=None)
+    headers = serializers.DictField(
+        child=serializers.CharField(), required=False, default=dict
+    )
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = BatchItemSerializer(
+        many=True, allow_empty=False, max_length=settings.BATCH["MAX_REQUESTS"]
+    )
+    # run every request in one transaction, rolled back at the first failure
+    atomic = serializers.BooleanField(default=False)
@@ -0,0 +1,116 @@
+import uuid
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.cache import month_cache
+from apps.events.models import Event
+from apps.events.views import EventMonthFilterListView
+from apps.users.models import User
+
+
+class BatchViewTests(TestCase):
+    def setUp(self):
+        month_cache.cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(2025, 3, 10, 9, 0))
+        Event.objects.create_event(
+            user=self.user,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="DAILY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+        )
+
+    def batch(self, requests: list[dict], atomic: bool = False, **headers):
+        response = self.client.post(
+            "/v1/batch/",
+            {"atomic": atomic, "requests": requests},
+            format="json",
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    @staticmethod
+    def create_request(year: int) -> dict:
+        return {
+            "method": "POST",
+            "path": "events/create/",
+            "body": {
+                "name": "Retro",
+                "description": "Sprint review",
+                "recurring_type": "WEEKLY",
+                "start_date": f"{year}-03-02",
+                "start_time": "15:00",
+                "end_date": f"{year}-03-02",
+                "end_time": "16:00",
+            },
+        }
+
+    def test_batch_request_headers_do_not_reach_sub_requests(self):
+        month = {"method": "GET", "path": "events/2025/3/"}
+        etag = self.batch([month])[0]["headers"]["ETag"]
+
+        responses = self.batch([month], **{"If-None-Match": etag})
+
+        self.assertEqual(responses[0]["status"], 200)
+
+    def test_sub_request_headers_apply(self):
+        month = {"method": "GET", "path": "events/2025/3/"}
+        etag = self.batch([month])[0]["headers"]["ETag"]
+
+        responses = self.batch([{**month, "headers": {"If-None-Match": etag}}])
+
+        self.assertEqual(responses[0]["status"], 304)
+
+    def test_read_after_write_in_an_atomic_batch_sees_the_write(self):
+        # the serializer only accepts events starting in the future
+        year = timezone.localdate().year + 1
+        path = f"/v1/events/{year}/3/"
+        cached = self.client.get(path).json()
+        create = self.create_request(year)
+        month = {"method": "GET", "path": f"events/{year}/3/"}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            responses = self.batch([create, month], atomic=True)
+
+        self.assertEqual(responses[0]["status"], 201)
+        self.assertIn("Retro", {item["name"] for item in responses[1]["body"]})
+        self.assertGreater(len(responses[1]["body"]), len(cached))
+        response = self.client.get(path)
+        self.assertEqual(response.json(), responses[1]["body"])
+        response = self.client.get(
+            path, HTTP_IF_NONE_MATCH=responses[1]["headers"]["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_sub_request_raising_does_not_fail_the_batch(self):
+        # the serializer only accepts events starting in the future
+        year = timezone.localdate().year + 1
+        unknown = {"method": "GET", "path": f"events/{uuid.uuid4()}/"}
+        month = {"method": "GET", "path": f"events/{year}/3/"}
+
+        responses = self.batch([self.create_request(year), unknown, month])
+
+        self.assertEqual([item["status"] for item in responses], [201, 404, 200])
+        self.assertTrue(Event.objects.filter(user=self.user, name="Retro").exists())
+
+    def test_sub_request_error_answers_500(self):
+        month = {"method": "GET", "path": "events/2025/3/"}
+
+        with (
+            mock.patch.object(
+                EventMonthFilterListView, "list", side_effect=RuntimeError("boom")
+            ),
+            self.assertLogs("apps.batch.views", "ERROR"),
+        ):
+            responses = self.batch([month, {"method": "GET", "path": "events/"}])
+
+        self.assertEqual([item["status"] for item in responses], [500, 200])
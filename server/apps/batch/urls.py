@@ -0,0 +1,11 @@
+from django.urls import path
+
+from apps.batch.views import BatchView
+
+urlpatterns = [
+    path(
+        "",
+        BatchView.as_view(),
+        name="batch",
+    ),
+]
@@ -0,0 +1,194 @@
+import json
+import logging
+from io import BytesIO
+from typing import Any
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.http import Http404
+from django.urls import Resolver404, resolve
+from drf_spectacular.utils import OpenApiExample, OpenApiRequest, extend_schema
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.batch.serializers import BatchSerializer
+from apps.events.models import Event
+
+logger = logging.getLogger(__name__)
+
+
+class BatchView(generics.GenericAPIView):
+    """
+    Several API calls in one round-trip. Every sub-request is resolved
+    through the URLconf and handed to its view as the already
+    authenticated user, responses come back in request order. A
+    sub-request raising answers 404 or 500 on its own, the other
+    responses are kept.
+
+    With ``atomic`` the sub-requests share one transaction. The first one
+    answering with an error rolls everything back, the ones after it are
+    not run.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = BatchSerializer
+
+    # taken over from the batch request, they describe the server and the
+    # connection; its headers (If-None-Match, cookies, ...) are not
+    inherited_environ = (
+        "SERVER_NAME",
+        "SERVER_PORT",
+        "SERVER_PROTOCOL",
+        "SCRIPT_NAME",
+        "REMOTE_ADDR",
+        "HTTP_HOST",
+    )
+
+    def build_request(self, request, item: dict) -> WSGIRequest:
+        path, _, query_string = item["path"].lstrip("/").partition("?")
+        body = b"" if item["body"] is None else json.dumps(item["body"]).encode()
+        environ = {
+            **{
+                key: request.META[key]
+                for key in self.inherited_environ
+                if key in request.META
+            },
+            "REQUEST_METHOD": item["method"],
+            "PATH_INFO": f"/{request.version}/{path}",
+            "QUERY_STRING": query_string,
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": BytesIO(body),
+            "wsgi.url_scheme": request.scheme,
+        }
+        for header, value in item["headers"].items():
+            environ[f"HTTP_{header.upper().replace('-', '_')}"] = value
+
+        sub_request = WSGIRequest(environ)
+        # picked up by DRF's Request, so the token is not checked again
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+        return sub_request
+
+    @staticmethod
+    def error(status_code: int, detail: str) -> dict[str, Any]:
+        return {"status": status_code, "headers": {}, "body": {"detail": detail}}
+
+    def run_request(self, request, item: dict) -> dict[str, Any]:
+        sub_request = self.build_request(request, item)
+        try:
+            match = resolve(sub_request.path_info)
+        except Resolver404:
+            return self.error(status.HTTP_404_NOT_FOUND, "Not found.")
+
+        view_class = getattr(match.func, "cls", None)
+        if (
+            view_class is None
+            or not issubclass(view_class, APIView)
+            or issubclass(view_class, BatchView)
+        ):
+            return self.error(status.HTTP_400_BAD_REQUEST, "Can not be batched.")
+
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+        except (ObjectDoesNotExist, Http404):
+            return self.error(status.HTTP_404_NOT_FOUND, "Not found.")
+        except Exception:
+            logger.exception(
+                f"User {request.user.id} batch request {item['method']} "
+                f"{item['path']} failed."
+            )
+            return self.error(status.HTTP_500_INTERNAL_SERVER_ERROR, "Server error.")
+        if hasattr(response, "render"):
+            response.render()
+
+        if response.streaming:
+            content = b"".join(response.streaming_content)
+        else:
+            content = response.content
+        if not content:
+            body = None
+        elif response.get("Content-Type", "").startswith("application/json"):
+            body = json.loads(content)
+        else:
+            body = content.decode(response.charset)
+
+        return {
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": body,
+        }
+
+    def run_atomic(self, request, items: list[dict]) -> list[dict[str, Any]]:
+        responses = []
+        with transaction.atomic():
+            for item in items:
+                responses.append(self.run_request(request, item))
+                if responses[-1]["status"] >= status.HTTP_400_BAD_REQUEST:
+                    transaction.set_rollback(True)
+                    break
+
+        if len(responses) < len(items) or responses[-1]["status"] >= 400:
+            # reads inside the transaction may have cached rolled back rows
+            Event.objects.discard_cached(request.user.id)
+            logger.info(
+                f"User {request.user.id} atomic batch rolled back at request "
+                f"{len(responses)} of {len(items)}."
+            )
+            responses.extend(
+                self.error(
+                    status.HTTP_424_FAILED_DEPENDENCY,
+                    "Not run, an earlier request of the atomic batch failed.",
+                )
+                for _ in items[len(responses) :]
+            )
+        return responses
+
+    @extend_schema(
+        tags=["batch"],
+        request=OpenApiRequest(
+            request=BatchSerializer,
+            examples=[
+                OpenApiExample(
+                    "Month and create",
+                    value={
+                        "atomic": False,
+                        "requests": [
+                            {"method": "GET", "path": "events/2025/3/"},
+                            {
+                                "method": "POST",
+                                "path": "events/create/",
+                                "body": {
+                                    "name": "Standup",
+                                    "description": "Daily sync",
+                                    "recurring_type": "DAILY",
+                                    "start_date": "2025-03-03",
+                                    "start_time": "09:00",
+                                    "end_date": "2025-03-03",
+                                    "end_time": "09:15",
+                                },
+                            },
+                            {
+                                "method": "GET",
+                                "path": "users/ada425db-1181-41af-a425-db118111aff9/",
+                            },
+                        ],
+                    },
+                )
+            ],
+        ),
+        description="Run several API requests in one round-trip.",
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["requests"]
+
+        if serializer.validated_data["atomic"]:
+            responses = self.run_atomic(request, items)
+        else:
+            responses = [self.run_request(request, item) for item in items]
+        return Response(responses)
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with a bounded number of entries
+    and hit/miss counters. With ``ttl`` (seconds) entries also expire.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        # monotonic expiry time by key, only filled with a ttl
+        self._expires: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if self.ttl is not None and self._expires[key] <= time.monotonic():
+                del self._data[key]
+                del self._expires[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.ttl is not None:
+                self._expires[key] = time.monotonic() + self.ttl
+            while len(self._data) > self.maxsize:
+                oldest, _value = self._data.popitem(last=False)
+                self._expires.pop(oldest, None)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """
+        Remove and return the value of ``key``, not counted as a hit or miss.
+        """
+        with self._lock:
+            self._expires.pop(key, None)
+            return self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+                self._expires.pop(key, None)
+            return len(keys)
+
+    def keys(self) -> list[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class Generations:
+    """
+    Per-key counters bumped on every invalidation.
+
+    A loader reads the generation before reading the data it caches and
+    stores the result only if the generation is unchanged, so a value
+    computed from data an invalidation has since replaced is dropped
+    instead of outliving it.
+    """
+
+    def __init__(self):
+        self._counters: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> int:
+        return self._counters.get(key, 0)
+
+    def bump(self, key: Hashable) -> None:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def call_if_current(
+        self, key: Hashable, generation: int, callback: Callable[[], None]
+    ) -> bool:
+        """
+        Run ``callback`` unless ``key`` was bumped since ``generation``
+        was read. No bump can slip in between the check and the call.
+        """
+        with self._lock:
+            if self._counters.get(key, 0) != generation:
+                return False
+            callback()
+            return True
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class EventsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.events"
+
+    def ready(self):
+        from apps.events.search import install_on_migrate
+
+        # migrations are generated per checkout, the FTS5 table lives outside them
+        post_migrate.connect(install_on_migrate, sender=self)
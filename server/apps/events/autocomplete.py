@@ -0,0 +1,101 @@
+import threading
+import uuid
+from bisect import bisect_left, insort
+from typing import Callable, Iterable
+
+from django.conf import settings
+
+from apps.common.cache import Generations, LRUCache
+
+
+class NameIndex:
+    """
+    Event names of one user kept sorted by their casefolded form,
+    so every name starting with a prefix is one contiguous run
+    found with a binary search.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.entries = sorted((name.casefold(), name) for name in names)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            insort(self.entries, (name.casefold(), name))
+
+    def remove(self, name: str) -> None:
+        entry = (name.casefold(), name)
+        with self._lock:
+            index = bisect_left(self.entries, entry)
+            if index < len(self.entries) and self.entries[index] == entry:
+                del self.entries[index]
+
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        prefix = prefix.casefold()
+        with self._lock:
+            index = bisect_left(self.entries, (prefix,))
+            names = []
+            for key, name in self.entries[index : index + limit]:
+                if not key.startswith(prefix):
+                    break
+                names.append(name)
+            return names
+
+
+class AutocompleteIndex:
+    """
+    Per-user name indexes, built on the first suggestion a user asks for
+    and evicted least recently used first.
+
+    Writes only touch indexes that are already loaded, an evicted user
+    is simply rebuilt from the database on the next request. An index
+    loaded while a write was applied may have missed it and is not kept.
+    """
+
+    def __init__(self, maxsize: int):
+        self.cache = LRUCache(maxsize=maxsize)
+        self.generations = Generations()
+
+    def suggest(
+        self,
+        user_id: uuid.UUID,
+        prefix: str,
+        limit: int,
+        load: Callable[[], Iterable[str]],
+    ) -> list[str]:
+        index = self.cache.get(user_id)
+        if index is None:
+            generation = self.generations.get(user_id)
+            index = NameIndex(load())
+            self.generations.call_if_current(
+                user_id, generation, lambda: self.cache.set(user_id, index)
+            )
+        return index.suggest(prefix, limit)
+
+    def update(
+        self,
+        user_id: uuid.UUID,
+        added: Iterable[str] = (),
+        removed: Iterable[str] = (),
+    ) -> None:
+        self.generations.bump(user_id)
+        index = self.cache.get(user_id)
+        if index is None:
+            return
+        for name in removed:
+            index.remove(name)
+        for name in added:
+            index.add(name)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        self.generations.bump(user_id)
+        self.cache.delete(user_id)
+
+    def stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+
+name_index = AutocompleteIndex(maxsize=settings.EVENTS["AUTOCOMPLETE_USERS"])
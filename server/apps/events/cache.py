@@ -0,0 +1,100 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+
+from apps.common.cache import LRUCache
+from apps.events.recurrence import iter_occurrence_spans
+from apps.events.utils import calendar_window_for_month
+
+logger = logging.getLogger(__name__)
+
+# (start_datetime, end_datetime, recurring_type) of an event
+EventSpan = tuple[datetime, datetime, str]
+
+
+class MonthCache:
+    """
+    Serialized month payloads keyed by (user, year, month, kind, version),
+    where kind tells apart the flat list from the tiled grid and version
+    is the user's events version read before loading the payload.
+
+    A write bumps the version, so no process can hit a payload loaded
+    before it, whether or not that process saw the invalidation. In the
+    writing process the entries of the previous version whose calendar
+    window has no occurrence of a written event are carried over to the
+    new version, the others are dropped.
+    """
+
+    def __init__(self, maxsize: int):
+        self.cache = LRUCache(maxsize=maxsize)
+
+    def get(
+        self,
+        user_id: uuid.UUID,
+        year: int,
+        month: int,
+        version: int,
+        kind: str = "list",
+    ) -> Optional[list | dict]:
+        return self.cache.get((user_id, year, month, kind, version))
+
+    def set(
+        self,
+        user_id: uuid.UUID,
+        year: int,
+        month: int,
+        version: int,
+        payload: list | dict,
+        kind: str = "list",
+    ) -> None:
+        self.cache.set((user_id, year, month, kind, version), payload)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        self.cache.delete_where(lambda key: key[0] == user_id)
+
+    @staticmethod
+    def overlaps_month(year: int, month: int, spans: list[EventSpan]) -> bool:
+        window_start, window_end = calendar_window_for_month(year, month)
+        for start, end, recurring_type in spans:
+            occurrences = iter_occurrence_spans(
+                start=start,
+                end=end,
+                recurring_type=recurring_type,
+                window_start=window_start,
+                window_end=window_end,
+            )
+            if next(occurrences, None) is not None:
+                return True
+        return False
+
+    def invalidate_spans(
+        self, user_id: uuid.UUID, spans: list[EventSpan], version: int
+    ) -> None:
+        """
+        Carry the user's payloads over to ``version``, the one the write of
+        ``spans`` committed, unless an occurrence falls into their month.
+        """
+        for key in self.cache.keys():
+            cached_user_id, year, month, kind, cached_version = key
+            if cached_user_id != user_id or cached_version >= version:
+                continue
+
+            payload = self.cache.pop(key)
+            # a version in between was written by another process
+            if payload is None or cached_version != version - 1:
+                continue
+
+            if self.overlaps_month(year, month, spans):
+                logger.debug(f"Month cache invalidated for {key}.")
+                continue
+
+            self.cache.set((user_id, year, month, kind, version), payload)
+
+    def stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+
+month_cache = MonthCache(maxsize=settings.EVENTS["MONTH_CACHE_SIZE"])
@@ -0,0 +1,325 @@
+import calendar
+import re
+from datetime import UTC, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from apps.events.enums import RecurringType
+from apps.events.recurrence import MONTH_STEPS
+
+PRODID = "-//calendar-in-angular//events//EN"
+
+RRULES = {
+    RecurringType.DAILY.value: "FREQ=DAILY",
+    RecurringType.WEEKLY.value: "FREQ=WEEKLY",
+    RecurringType.MONTHLY.value: "FREQ=MONTHLY",
+    RecurringType.YEARLY.value: "FREQ=YEARLY",
+}
+
+# RFC 5545 3.1: lines longer than 75 octets are folded
+MAX_LINE_OCTETS = 75
+
+
+class ICalendarRenderer(BaseRenderer):
+    """
+    Lets content negotiation accept ``text/calendar`` for views
+    that stream iCalendar responses themselves. Anything else handed
+    to it (error details) is rendered as JSON.
+    """
+
+    media_type = "text/calendar"
+    format = "ics"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        return JSONRenderer().render(data, renderer_context=renderer_context)
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def format_datetime(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_local_datetime(value: datetime, zone: tzinfo) -> str:
+    return value.astimezone(zone).strftime("%Y%m%dT%H%M%S")
+
+
+def format_offset(offset: timedelta) -> str:
+    minutes = int(offset.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def format_rrule(recurring_type: str, start: datetime) -> Optional[str]:
+    """
+    The RRULE of a recurring event starting at the local ``start``.
+
+    Monthly and yearly recurrences on the 29th-31st fall on the last day
+    of shorter months (see ``add_months``), where a bare RFC 5545 rule
+    would skip those months. The last of the days up to the start day
+    that the month has (``BYSETPOS=-1``) picks the same dates.
+    """
+    rule = RRULES.get(recurring_type)
+    if rule is None or recurring_type not in MONTH_STEPS or start.day <= 28:
+        return rule
+
+    if recurring_type == RecurringType.YEARLY.value:
+        rule += f";BYMONTH={start.month}"
+    days = ",".join(str(day) for day in range(28, start.day + 1))
+    return f"{rule};BYMONTHDAY={days};BYSETPOS=-1"
+
+
+def find_transitions(zone: tzinfo, year: int) -> list[tuple[datetime, timedelta]]:
+    """
+    The UTC offset changes of ``zone`` during ``year``, as the UTC moment
+    of the change and the offset in force before it.
+    """
+    transitions = []
+    day = datetime(year, 1, 1, tzinfo=UTC)
+    offset = day.astimezone(zone).utcoffset()
+    while day.year == year:
+        next_day = day + timedelta(days=1)
+        next_offset = next_day.astimezone(zone).utcoffset()
+        if next_offset != offset:
+            # first minute of the day in the new offset
+            low, high = 0, 24 * 60
+            while high - low > 1:
+                middle = (low + high) // 2
+                moment = day + timedelta(minutes=middle)
+                if moment.astimezone(zone).utcoffset() == offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append((day + timedelta(minutes=high), offset))
+        day, offset = next_day, next_offset
+    return transitions
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> int:
+    """
+    The day of the month of its ``n``-th ``weekday``, counted from the
+    end for a negative ``n``.
+    """
+    days = [
+        day
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+        if calendar.weekday(year, month, day) == weekday
+    ]
+    return days[n - 1] if n > 0 else days[n]
+
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+@lru_cache(maxsize=32)
+def format_timezone(zone: ZoneInfo, year: int) -> str:
+    """
+    A VTIMEZONE for ``zone`` with the offset rules in force in ``year``,
+    repeated yearly from 1970 (e.g. the last Sunday of March and October
+    for Europe/Warsaw).
+    """
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{zone.key}"]
+    transitions = find_transitions(zone, year)
+    if not transitions:
+        moment = datetime(year, 1, 1, tzinfo=UTC).astimezone(zone)
+        offset = format_offset(moment.utcoffset())
+        lines += [
+            "BEGIN:STANDARD",
+            "DTSTART:19700101T000000",
+            f"TZOFFSETFROM:{offset}",
+            f"TZOFFSETTO:{offset}",
+            f"TZNAME:{moment.tzname()}",
+            "END:STANDARD",
+        ]
+
+    for moment, offset_from in transitions:
+        # observances start at the wall clock time of the old offset
+        local = (moment + offset_from).replace(tzinfo=None)
+        after = moment.astimezone(zone)
+        last = local.day + 7 > calendar.monthrange(local.year, local.month)[1]
+        n = -1 if last else (local.day - 1) // 7 + 1
+        weekday = local.weekday()
+        first = local.replace(year=1970, day=nth_weekday(1970, local.month, weekday, n))
+        component = "DAYLIGHT" if after.dst() else "STANDARD"
+        lines += [
+            f"BEGIN:{component}",
+            f"DTSTART:{first.strftime('%Y%m%dT%H%M%S')}",
+            f"RRULE:FREQ=YEARLY;BYMONTH={local.month};BYDAY={n}{WEEKDAYS[weekday]}",
+            f"TZOFFSETFROM:{format_offset(offset_from)}",
+            f"TZOFFSETTO:{format_offset(after.utcoffset())}",
+            f"TZNAME:{after.tzname()}",
+            f"END:{component}",
+        ]
+    lines.append("END:VTIMEZONE")
+    return "".join(fold(line) for line in lines)
+
+
+def fold(line: str) -> str:
+    """
+    Fold a content line at 75 octets without splitting UTF-8 sequences.
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return f"{line}\r\n"
+
+    parts, limit, start = [], MAX_LINE_OCTETS, 0
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # step back to the first byte of a UTF-8 sequence
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start = end
+        # continuation lines start with a space
+        limit = MAX_LINE_OCTETS - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_event(row: Any, stamp: str, zone: Optional[ZoneInfo] = None) -> str:
+    """
+    A VEVENT. With ``zone`` its times are local to it (``TZID``), so the
+    recurrence follows the wall clock across DST changes like the
+    server's expansion does, otherwise they are in UTC.
+    """
+    if zone is None:
+        start = f"DTSTART:{format_datetime(row.start_datetime)}"
+        end = f"DTEND:{format_datetime(row.end_datetime)}"
+    else:
+        start = (
+            f"DTSTART;TZID={zone.key}:{format_local_datetime(row.start_datetime, zone)}"
+        )
+        end = f"DTEND;TZID={zone.key}:{format_local_datetime(row.end_datetime, zone)}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{row.id}",
+        f"DTSTAMP:{stamp}",
+        start,
+        end,
+        f"SUMMARY:{escape_text(row.name)}",
+        f"DESCRIPTION:{escape_text(row.description)}",
+    ]
+    rrule = format_rrule(row.recurring_type, row.start_datetime.astimezone(zone or UTC))
+    if rrule is not None:
+        lines.append(f"RRULE:{rrule}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+def iter_calendar(rows: Iterable[Any]) -> Iterator[str]:
+    """
+    A VCALENDAR document, one VEVENT per row, produced as rows are read.
+    Times are written in the current timezone, described by a VTIMEZONE.
+    """
+    now = timezone.now()
+    stamp = format_datetime(now)
+    zone = timezone.get_current_timezone()
+    if not isinstance(zone, ZoneInfo):
+        zone = None
+    yield f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{PRODID}\r\nCALSCALE:GREGORIAN\r\n"
+    if zone is not None:
+        yield format_timezone(zone, now.year)
+    for row in rows:
+        yield format_event(row, stamp, zone)
+    yield "END:VCALENDAR\r\n"
+
+
+UNESCAPES = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+
+def unescape_text(value: str) -> str:
+    return re.sub(r"\\(.)", lambda match: UNESCAPES.get(match[1], match[1]), value)
+
+
+def iter_unfolded(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """
+    Content lines with folding undone, paired with the number of the
+    physical line each one starts on.
+    """
+    number, current = 0, None
+    for index, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield number, current
+        number, current = index, line
+    if current:
+        yield number, current
+
+
+def parse_property(line: str) -> tuple[str, dict[str, str], str]:
+    """
+    Split ``NAME;PARAM=VALUE:value`` into its name, parameters and value.
+    """
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def parse_datetime_value(value: str, parameters: dict[str, str]) -> datetime:
+    """
+    DATE values start at local midnight, floating times are local
+    and UTC (``Z``) or TZID times keep their zone.
+    """
+    try:
+        if parameters.get("VALUE") == "DATE" or len(value) == 8:
+            parsed = datetime.strptime(value, "%Y%m%d")
+        else:
+            parsed = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise ValueError(f"Invalid date-time value: {value}.")
+
+    if value.endswith("Z"):
+        return parsed.replace(tzinfo=UTC)
+    if "TZID" in parameters:
+        try:
+            return parsed.replace(tzinfo=ZoneInfo(parameters["TZID"]))
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return timezone.make_aware(parsed)
+
+
+def iter_vevents(
+    lines: Iterable[str],
+) -> Iterator[tuple[int, dict[str, tuple[dict[str, str], str]]]]:
+    """
+    The properties of each VEVENT as ``{name: (parameters, value)}``,
+    paired with the line the VEVENT starts on. Nested components
+    (e.g. VALARM) are skipped.
+    """
+    properties, start, depth = None, 0, 0
+    for number, line in iter_unfolded(lines):
+        name, parameters, value = parse_property(line)
+        if name == "BEGIN":
+            if properties is not None:
+                depth += 1
+            elif value.upper() == "VEVENT":
+                properties, start, depth = {}, number, 0
+        elif name == "END" and properties is not None:
+            if depth:
+                depth -= 1
+            elif value.upper() == "VEVENT":
+                yield start, properties
+                properties = None
+        elif properties is not None and not depth:
+            properties.setdefault(name, (parameters, value))
@@ -0,0 +1,206 @@
+import csv
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.events.enums import RecurringType
+from apps.events.ical import (
+    iter_vevents,
+    parse_datetime_value,
+    unescape_text,
+)
+from apps.events.models import Event
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+# (source line, parsed event fields or None, error or None)
+Record = tuple[int, Optional[dict], Optional[str]]
+
+CSV_COLUMNS = (
+    "name",
+    "description",
+    "recurring_type",
+    "start_datetime",
+    "end_datetime",
+)
+
+# RRULE parts the events model can not express
+UNSUPPORTED_RRULE_PARTS = ("COUNT", "UNTIL")
+
+
+@dataclass(slots=True)
+class ImportBatch:
+    number: int
+    created: int = 0
+    errors: dict[int, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.created / self.seconds if self.seconds else 0.0
+
+
+def parse_recurring_type(rule: Optional[str]) -> str:
+    if rule is None:
+        raise ValueError("Only recurring events (RRULE) can be imported.")
+    parts = dict(part.partition("=")[::2] for part in rule.upper().split(";"))
+    if parts.get("FREQ") not in RecurringType.values():
+        raise ValueError(f"Unsupported recurrence frequency: {parts.get('FREQ')}.")
+    if parts.get("INTERVAL", "1") != "1" or any(
+        part in parts for part in UNSUPPORTED_RRULE_PARTS
+    ):
+        raise ValueError(f"Unsupported recurrence rule: {rule}.")
+    return parts["FREQ"]
+
+
+def ics_records(lines: Iterable[str]) -> Iterator[Record]:
+    for line, properties in iter_vevents(lines):
+        try:
+            if "DTSTART" not in properties:
+                raise ValueError("DTSTART is required.")
+            parameters, value = properties["DTSTART"]
+            start_datetime = parse_datetime_value(value, parameters)
+            if "DTEND" in properties:
+                end_parameters, end_value = properties["DTEND"]
+                end_datetime = parse_datetime_value(end_value, end_parameters)
+            elif parameters.get("VALUE") == "DATE":
+                end_datetime = start_datetime + timedelta(days=1)
+            else:
+                raise ValueError("DTEND is required.")
+
+            item = {
+                "name": unescape_text(properties.get("SUMMARY", ({}, ""))[1]),
+                "description": unescape_text(
+                    properties.get("DESCRIPTION", ({}, ""))[1]
+                ),
+                "recurring_type": parse_recurring_type(
+                    properties.get("RRULE", ({}, None))[1]
+                ),
+                "start_datetime": start_datetime,
+                "end_datetime": end_datetime,
+            }
+        except ValueError as error:
+            yield line, None, str(error)
+        else:
+            yield line, item, None
+
+
+def parse_csv_datetime(value: str) -> datetime:
+    parsed = parse_datetime(value or "")
+    if parsed is None:
+        raise ValueError(f"Invalid datetime: {value}.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def csv_records(lines: Iterable[str]) -> Iterator[Record]:
+    """
+    Rows of a CSV file with a header naming the ``CSV_COLUMNS``,
+    datetimes in ISO 8601 (naive values are local time).
+    """
+    reader = csv.DictReader(lines)
+    missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValidationError(f"Missing CSV columns: {', '.join(sorted(missing))}.")
+
+    for row in reader:
+        try:
+            item = {
+                "name": row["name"],
+                "description": row["description"],
+                "recurring_type": row["recurring_type"],
+                "start_datetime": parse_csv_datetime(row["start_datetime"]),
+                "end_datetime": parse_csv_datetime(row["end_datetime"]),
+            }
+        except ValueError as error:
+            yield reader.line_num, None, str(error)
+        else:
+            yield reader.line_num, item, None
+
+
+def validate_item(item: dict) -> None:
+    """
+    The field checks of ``EventSerializer`` that do not need the database.
+    Past events are allowed, an imported calendar brings its history.
+    """
+    name_length = Event._meta.get_field("name").max_length
+    description_length = Event._meta.get_field("description").max_length
+    if not item["name"]:
+        raise ValueError("Name is required.")
+    if len(item["name"]) > name_length:
+        raise ValueError(f"Name can not be longer than {name_length} characters.")
+    if len(item["description"] or "") > description_length:
+        raise ValueError(
+            f"Description can not be longer than {description_length} characters."
+        )
+    if item["recurring_type"] not in RecurringType.values():
+        raise ValueError("Invalid recurring type.")
+    if item["start_datetime"] > item["end_datetime"]:
+        raise ValueError("Start datetime should be earlier than end datetime.")
+
+
+def import_events(
+    user: "User", records: Iterable[Record], batch_size: Optional[int] = None
+) -> Iterator[ImportBatch]:
+    """
+    Create events from parsed records, one batch at a time.
+
+    Each batch is validated in memory, deduplicated against the user's
+    names with one query and written with ``bulk_create`` by
+    ``EventManager.bulk_create_events``. Batches commit independently,
+    errors are reported per source line.
+    """
+    batch_size = batch_size or settings.EVENTS["CHUNK_SIZE"]
+    records = iter(records)
+    number = 0
+    while True:
+        # records are parsed lazily, so the timing includes parsing
+        started = perf_counter()
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        number += 1
+        report = ImportBatch(number=number)
+        items, lines = [], []
+        for line, item, error in batch:
+            if error is None:
+                try:
+                    validate_item(item)
+                except ValueError as validation_error:
+                    error = str(validation_error)
+            if error is not None:
+                report.errors[line] = error
+                continue
+            item["description"] = item["description"] or ""
+            items.append(item)
+            lines.append(line)
+
+        if items:
+            try:
+                created, errors = Event.objects.bulk_create_events(user, items)
+            except ValidationError as error:
+                report.errors.update({line: error.messages[0] for line in lines})
+            else:
+                report.created = len(created)
+                report.errors.update(
+                    {lines[index]: message for index, message in errors.items()}
+                )
+
+        report.seconds = perf_counter() - started
+        logger.info(
+            f"User {user.id} import batch {number}: {report.created} created, "
+            f"{len(report.errors)} failed, {report.events_per_second:.0f} events/s."
+        )
+        yield report
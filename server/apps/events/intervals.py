@@ -0,0 +1,83 @@
+import heapq
+from datetime import datetime, time, timedelta
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from django.utils import timezone
+
+Interval = tuple[datetime, datetime]
+
+T = TypeVar("T")
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Sort by start and sweep once, joining intervals that overlap or touch.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def iter_off_hours(
+    window_start: datetime, window_end: datetime, work_start: time, work_end: time
+) -> Iterator[Interval]:
+    """
+    The time outside [work_start, work_end) of every local day touching
+    the window, in order, so it can be swept like busy intervals.
+    """
+    day = timezone.localtime(window_start).date()
+    off_start = timezone.make_aware(datetime.combine(day, time.min))
+    while off_start < window_end:
+        yield off_start, timezone.make_aware(datetime.combine(day, work_start))
+        off_start = timezone.make_aware(datetime.combine(day, work_end))
+        day += timedelta(days=1)
+
+
+def iter_free_slots(
+    busy: Iterable[Iterable[Interval]],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+) -> Iterator[Interval]:
+    """
+    Gaps of at least ``duration`` inside the window that no busy interval
+    covers, earliest first.
+
+    ``busy`` holds streams that are each sorted by start. They are swept
+    as one k-way merge without being merged up front, so the streams
+    are only consumed up to the last gap that is asked for.
+    """
+    cursor = window_start
+    for start, end in heapq.merge(*busy):
+        if start >= window_end:
+            break
+        if start - cursor >= duration:
+            yield cursor, start
+        if end > cursor:
+            cursor = end
+    if window_end - cursor >= duration:
+        yield cursor, window_end
+
+
+def iter_overlapping_pairs(
+    items: Iterable[T], span: Callable[[T], Interval]
+) -> Iterator[tuple[T, T]]:
+    """
+    Every pair of items whose spans overlap, for items sorted by start.
+
+    A heap keeps the items still active at the sweep position ordered by
+    end, so the cost is O(n log n) plus the number of pairs reported.
+    """
+    active = []
+    for position, item in enumerate(items):
+        start, end = span(item)
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _end, _position, other in active:
+            yield other, item
+        heapq.heappush(active, (end, position, item))
@@ -1,18 +1,33 @@
 import calendar
 import logging
 import uuid
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, time, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models, transaction
-from django.db.models import Q, QuerySet
+from django.db.models import F, Q, QuerySet
 from django.utils import timezone
 
-from apps.events.utils import get_next_month, get_prev_month, grid_range_for_month
+from apps.events.autocomplete import name_index
+from apps.events.cache import EventSpan, month_cache
+from apps.events.enums import RecurringType
+from apps.events.intervals import (
+    Interval,
+    iter_free_slots,
+    iter_off_hours,
+    iter_overlapping_pairs,
+    merge_intervals,
+)
+from apps.events.pubsub import broker
+from apps.events.recurrence import Occurrence, expand_events, iter_occurrence_spans
+from apps.events.utils import calendar_window_for_month, grid_range_for_month
 
 if TYPE_CHECKING:
-    from apps.events.models import Event
+    from apps.events.models import Event, EventOccurrence, OccurrenceHorizon
     from apps.users.models import User
 
 logger = logging.getLogger(__name__)
@@ -28,6 +43,93 @@ class EventManager(models.Manager):
     def is_exists(self, user: "User" = None, name: str = None, **kwargs) -> bool:
         return self.filter(user=user, name=name, **kwargs).exists()
 
+    @staticmethod
+    def validate_duration(start_datetime: datetime, end_datetime: datetime) -> None:
+        if end_datetime - start_datetime > settings.EVENTS["MAX_DURATION"]:
+            raise ValidationError(
+                f"Event can not last longer than {settings.EVENTS['MAX_DURATION']}."
+            )
+
+    def find_conflicts(
+        self,
+        user: "User",
+        start_datetime: datetime,
+        end_datetime: datetime,
+        recurring_type: str,
+        exclude_id: Optional[uuid.UUID] = None,
+    ) -> list[Occurrence]:
+        """
+        Occurrences of the user's other events overlapping any occurrence
+        of the given event up to ``EVENTS["OCCURRENCE_HORIZON"]`` ahead.
+
+        When the materialized occurrences cover the event's first span, the
+        check stops at the horizon's end and the existing occurrences are
+        read with one range seek on the per-user occurrence index. Otherwise
+        the user's events are expanded over the whole window in memory. The
+        event's own occurrences are expanded in memory and both are swept
+        together once.
+        """
+        from apps.events.models import EventOccurrence, OccurrenceHorizon
+
+        window_end = max(
+            end_datetime,
+            max(start_datetime, timezone.now()) + settings.EVENTS["OCCURRENCE_HORIZON"],
+        )
+        horizon = OccurrenceHorizon.objects.get_horizon()
+        if EventOccurrence.objects.covers(horizon, start_datetime, end_datetime):
+            window_end = min(window_end, horizon.materialized_until)
+            occurrences = [
+                EventOccurrence.objects.to_occurrence(row)
+                for row in EventOccurrence.objects.window_rows(
+                    user, start_datetime, window_end
+                )
+            ]
+        else:
+            occurrences = self.filter_occurrences(user, start_datetime, window_end)
+        existing = [
+            occurrence for occurrence in occurrences if occurrence.id != exclude_id
+        ]
+        # the event's own occurrences are tagged with None
+        spans = [
+            (None, start, end)
+            for start, end in iter_occurrence_spans(
+                start=start_datetime,
+                end=end_datetime,
+                recurring_type=recurring_type,
+                window_start=start_datetime,
+                window_end=window_end,
+            )
+        ]
+        spans.extend(
+            (occurrence, occurrence.start_datetime, occurrence.end_datetime)
+            for occurrence in existing
+        )
+        spans.sort(key=lambda item: item[1])
+
+        conflicts = {}
+        for first, second in iter_overlapping_pairs(
+            spans, span=lambda item: (item[1], item[2])
+        ):
+            if (first[0] is None) != (second[0] is None):
+                occurrence = first[0] or second[0]
+                conflicts[(occurrence.id, occurrence.start_datetime)] = occurrence
+        return list(conflicts.values())
+
+    def validate_conflicts(
+        self,
+        user: "User",
+        start_datetime: datetime,
+        end_datetime: datetime,
+        recurring_type: str,
+        exclude_id: Optional[uuid.UUID] = None,
+    ) -> None:
+        conflicts = self.find_conflicts(
+            user, start_datetime, end_datetime, recurring_type, exclude_id
+        )
+        if conflicts:
+            names = ", ".join(sorted({occurrence.name for occurrence in conflicts}))
+            raise ValidationError(f"Event overlaps with: {names}.")
+
     def create_event(
         self,
         user: "User",
@@ -36,6 +138,7 @@ class EventManager(models.Manager):
         recurring_type: str,
         start_datetime: datetime,
         end_datetime: datetime,
+        check_conflicts: bool = False,
         **kwargs,
     ) -> Optional["Event"]:
         try:
@@ -46,7 +149,13 @@ class EventManager(models.Manager):
                     )
                     raise ValidationError("Event with this name already exists.")
 
-                event = self.create(
+                self.validate_duration(start_datetime, end_datetime)
+                if check_conflicts:
+                    self.validate_conflicts(
+                        user, start_datetime, end_datetime, recurring_type
+                    )
+
+                event = self.model(
                     user=user,
                     name=name,
                     description=description,
@@ -55,6 +164,12 @@ class EventManager(models.Manager):
                     end_datetime=end_datetime,
                     **kwargs,
                 )
+                event.change_number = self.events_changed(
+                    user.id, [self.get_span(event)]
+                )
+                event.save(force_insert=True, using=self.db)
+                self.refresh_occurrences([event], created=True)
+                self.names_changed(user.id, added=[name])
                 logger.info(f"User {user.id} created event with name {name}.")
                 return event
         except Exception as error:
@@ -70,6 +185,7 @@ class EventManager(models.Manager):
         recurring_type: Optional[str] = None,
         start_datetime: Optional[datetime] = None,
         end_datetime: Optional[datetime] = None,
+        check_conflicts: bool = False,
         **kwargs,
     ) -> Optional["Event"]:
         try:
@@ -80,6 +196,9 @@ class EventManager(models.Manager):
                     logger.error(f"Event with id {event_id} does not exist.")
                     raise ValidationError("Event with this id does not exist.")
 
+                old_span = self.get_span(event)
+                old_name = event.name
+
                 if name is not None and event.name != name:
                     event.name = name
                     update_fields.append("name")
@@ -92,7 +211,7 @@ class EventManager(models.Manager):
                     recurring_type is not None
                     and event.recurring_type != recurring_type
                 ):
-                    if recurring_type not in Event.RecurringType.values:
+                    if recurring_type not in RecurringType.values():
                         raise ValidationError("Invalid recurring type")
                     event.recurring_type = recurring_type
                     update_fields.append("recurring_type")
@@ -113,8 +232,28 @@ class EventManager(models.Manager):
                         setattr(event, field, value)
                         update_fields.append(field)
 
+                self.validate_duration(event.start_datetime, event.end_datetime)
+                if check_conflicts:
+                    self.validate_conflicts(
+                        event.user_id,
+                        event.start_datetime,
+                        event.end_datetime,
+                        event.recurring_type,
+                        exclude_id=event.id,
+                    )
+
                 if update_fields:
-                    event.save(update_fields=update_fields)
+                    event.change_number = self.events_changed(
+                        event.user_id, [old_span, self.get_span(event)]
+                    )
+                    event.save(
+                        update_fields=[*update_fields, "updated_at", "change_number"]
+                    )
+                    self.refresh_occurrences([event])
+                    if event.name != old_name:
+                        self.names_changed(
+                            event.user_id, added=[event.name], removed=[old_name]
+                        )
                     logger.info(
                         f"User {user.id} updated event {event_id}. Updated fields: {update_fields}"
                     )
@@ -122,7 +261,7 @@ class EventManager(models.Manager):
                     logger.info(f"No changes detected for event {event_id}")
 
                 return event
-        except Event.DoesNotExist:
+        except self.model.DoesNotExist:
             logger.error(f"Event with id {event_id} does not exist.")
             raise ValidationError("Event does not exist.")
         except IntegrityError:
@@ -135,46 +274,706 @@ class EventManager(models.Manager):
         return None
 
     def delete_event(self, event_id: uuid.UUID) -> bool:
+        # materialized occurrences are removed by the cascade
         event = self.get(id=event_id)
         if not event:
             logger.error(f"Event with id {event_id} does not exist.")
             raise ValidationError("Event does not exist.")
 
         try:
-            event.delete()
+            with transaction.atomic():
+                change_number = self.events_changed(
+                    event.user_id, [self.get_span(event)]
+                )
+                event.delete()
+                self.record_deletions(event.user_id, [event_id], change_number)
+                self.names_changed(event.user_id, removed=[event.name])
             logger.info(f"Event with id {event_id} deleted.")
             return True
         except Exception as error:
             logger.error(f"Failed to delete event with id {event_id}.")
             raise ValidationError(f"Failed to delete event: {error}")
 
+    def bulk_create_events(
+        self, user: "User", items: list[dict]
+    ) -> tuple[dict[int, "Event"], dict[int, str]]:
+        """
+        Create many events of one user in a single transaction.
+
+        Name uniqueness is checked for the whole batch with one query and
+        rows are written with ``bulk_create``. Returns the created events
+        and the error messages, both keyed by the position in ``items``.
+        """
+        created, errors = {}, {}
+        names = [item["name"] for item in items]
+        taken = set(
+            self.filter(user=user, name__in=names).values_list("name", flat=True)
+        )
+
+        events = {}
+        for index, item in enumerate(items):
+            name = item["name"]
+            if name in taken:
+                errors[index] = "Event with this name already exists."
+                continue
+            try:
+                self.validate_duration(item["start_datetime"], item["end_datetime"])
+            except ValidationError as error:
+                errors[index] = error.messages[0]
+                continue
+
+            taken.add(name)
+            events[index] = self.model(
+                user=user,
+                name=name,
+                description=item["description"],
+                recurring_type=item["recurring_type"],
+                start_datetime=item["start_datetime"],
+                end_datetime=item["end_datetime"],
+            )
+
+        if not events:
+            return created, errors
+
+        try:
+            with transaction.atomic():
+                change_number = self.events_changed(
+                    user.id, [self.get_span(event) for event in events.values()]
+                )
+                for event in events.values():
+                    event.change_number = change_number
+                self.bulk_create(
+                    events.values(), batch_size=settings.EVENTS["CHUNK_SIZE"]
+                )
+                self.refresh_occurrences(list(events.values()), created=True)
+                self.names_changed(
+                    user.id, added=[event.name for event in events.values()]
+                )
+        except IntegrityError as error:
+            logger.error(f"User {user.id} failed to bulk create events: {error}")
+            raise ValidationError(f"Failed to create events: {error}")
+
+        created.update(events)
+        logger.info(f"User {user.id} created {len(events)} events in bulk.")
+        return created, errors
+
+    def filter_selection(
+        self,
+        user: "User",
+        ids: Optional[list[uuid.UUID]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        recurring_type: Optional[str] = None,
+    ) -> QuerySet["Event"]:
+        """
+        The user's events picked by ids and/or a filter. A date range
+        selects events whose stored span overlaps it.
+        """
+        if start_datetime is not None and end_datetime is not None:
+            queryset = self.filter_overlapping(user, start_datetime, end_datetime)
+        else:
+            queryset = self.filter(user=user)
+            if start_datetime is not None:
+                queryset = queryset.filter(end_datetime__gt=start_datetime)
+            if end_datetime is not None:
+                queryset = queryset.filter(start_datetime__lt=end_datetime)
+
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        if recurring_type is not None:
+            queryset = queryset.filter(recurring_type=recurring_type)
+        return queryset
+
+    def bulk_update_events(
+        self,
+        user: "User",
+        queryset: QuerySet["Event"],
+        description: Optional[str] = None,
+        recurring_type: Optional[str] = None,
+        shift: Optional[timedelta] = None,
+    ) -> int:
+        """
+        Apply the same change to every selected event with set-based UPDATEs
+        in one transaction. Derived data is refreshed once for the batch.
+        """
+        changes = {}
+        if description is not None:
+            changes["description"] = description
+        if recurring_type is not None:
+            if recurring_type not in RecurringType.values():
+                raise ValidationError("Invalid recurring type")
+            changes["recurring_type"] = recurring_type
+        if shift:
+            changes["start_datetime"] = F("start_datetime") + shift
+            changes["end_datetime"] = F("end_datetime") + shift
+        if not changes:
+            return 0
+        changes["updated_at"] = timezone.now()
+
+        ids = list(queryset.values_list("id", flat=True))
+        chunk_size = settings.EVENTS["CHUNK_SIZE"]
+        with transaction.atomic():
+            if ids:
+                changes["change_number"] = self.events_changed(user.id)
+            for offset in range(0, len(ids), chunk_size):
+                chunk = ids[offset : offset + chunk_size]
+                self.filter(user=user, id__in=chunk).update(**changes)
+                if "recurring_type" in changes or shift:
+                    self.refresh_occurrences(list(self.filter(id__in=chunk)))
+
+        logger.info(f"User {user.id} updated {len(ids)} events in bulk.")
+        return len(ids)
+
+    def bulk_delete_events(self, user: "User", queryset: QuerySet["Event"]) -> int:
+        """
+        Delete every selected event in one transaction, occurrences go with
+        the cascade and derived data is refreshed once for the batch.
+        """
+        ids = list(queryset.values_list("id", flat=True))
+        chunk_size = settings.EVENTS["CHUNK_SIZE"]
+        with transaction.atomic():
+            for offset in range(0, len(ids), chunk_size):
+                self.filter(
+                    user=user, id__in=ids[offset : offset + chunk_size]
+                ).delete()
+            if ids:
+                change_number = self.events_changed(user.id)
+                self.record_deletions(user.id, ids, change_number)
+                self.names_changed(user.id)
+
+        logger.info(f"User {user.id} deleted {len(ids)} events in bulk.")
+        return len(ids)
+
+    @staticmethod
+    def get_span(event: "Event") -> EventSpan:
+        return event.start_datetime, event.end_datetime, event.recurring_type
+
+    @staticmethod
+    def events_changed(
+        user_id: uuid.UUID, spans: Optional[list[EventSpan]] = None
+    ) -> int:
+        """
+        Bump the user's events version within the write transaction, drop
+        derived read data touched by the write and notify the user's open
+        event streams once the transaction commits.
+        Without spans every cached month of the user is dropped, with them
+        the untouched months are carried over to the new version.
+
+        Returns the new version, the change number the written rows and
+        tombstones are stamped with.
+        """
+        change_number = get_user_model().objects.bump_events_version(user_id)
+        if spans is None:
+            transaction.on_commit(lambda: month_cache.invalidate_user(user_id))
+        else:
+            transaction.on_commit(
+                lambda: month_cache.invalidate_spans(user_id, spans, change_number)
+            )
+        transaction.on_commit(
+            lambda: broker.publish(
+                user_id, {"type": "changed", "at": timezone.now().isoformat()}
+            )
+        )
+        return change_number
+
+    @staticmethod
+    def names_changed(
+        user_id: uuid.UUID, added: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Apply committed name changes to the user's autocomplete index.
+        Without any names the index is dropped and rebuilt on next use.
+        """
+        if not added and not removed:
+            transaction.on_commit(lambda: name_index.invalidate_user(user_id))
+        else:
+            transaction.on_commit(
+                lambda: name_index.update(user_id, added=added, removed=removed)
+            )
+
+    @staticmethod
+    def discard_cached(user_id: uuid.UUID) -> None:
+        """
+        Drop the user's in-process read caches. Needed after rolling back a
+        transaction whose reads may have filled them with rolled back rows.
+        """
+        month_cache.invalidate_user(user_id)
+        name_index.invalidate_user(user_id)
+
+    def suggest_names(self, user: "User", prefix: str, limit: int) -> list[str]:
+        """
+        Names of the user's events starting with ``prefix`` (case-insensitive),
+        served from the in-process autocomplete index.
+        """
+        return name_index.suggest(
+            user.id,
+            prefix,
+            limit,
+            load=lambda: self.filter(user=user).values_list("name", flat=True),
+        )
+
+    @staticmethod
+    def record_deletions(
+        user_id: uuid.UUID, event_ids: list[uuid.UUID], change_number: int
+    ) -> None:
+        from apps.events.models import EventTombstone
+
+        EventTombstone.objects.record(user_id, event_ids, change_number)
+
+    def changes_since(
+        self, user: "User", since: int
+    ) -> tuple[QuerySet["Event"], list[uuid.UUID]]:
+        """
+        The user's events written and the ids of events deleted after the
+        change number ``since``, both read through their
+        (user, change_number) indexes.
+        """
+        from apps.events.models import EventTombstone
+
+        changed = self.filter(user=user, change_number__gt=since).order_by(
+            "change_number"
+        )
+        deleted = list(
+            EventTombstone.objects.filter(user=user, change_number__gt=since)
+            .order_by("change_number")
+            .values_list("event_id", flat=True)
+        )
+        return changed, deleted
+
+    @staticmethod
+    def refresh_occurrences(events: list["Event"], created: bool = False) -> None:
+        from apps.events.models import EventOccurrence
+
+        EventOccurrence.objects.refresh_event_occurrences(events, created=created)
+
+    def filter_overlapping(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> QuerySet["Event"]:
+        """
+        Events whose stored span overlaps [window_start, window_end).
+
+        Since no event lasts longer than ``EVENTS["MAX_DURATION"]``, the start
+        is bounded on both sides and the lookup is a range seek on the
+        (user, start_datetime, end_datetime) index instead of a scan.
+        """
+        return self.filter(
+            user=user,
+            start_datetime__gt=window_start - settings.EVENTS["MAX_DURATION"],
+            start_datetime__lt=window_end,
+            end_datetime__gt=window_start,
+        )
+
     def filter_calendar_month_events(
         self, user: "User", month: int, year: int
-    ) -> QuerySet["Event"]:
+    ) -> list[Occurrence]:
         """
         For a given user, it downloads events for three months (previous, current, next),
         Where the month is represented by a network of 42 fields (tiles) on the calendar.
+
+        Recurring events are expanded into the occurrences falling inside
+        the three grids, sorted by occurrence start.
+        """
+        overall_start, overall_end = calendar_window_for_month(year, month)
+
+        return self.filter_occurrences(user, overall_start, overall_end)
+
+    def filter_calendar_grid_events(
+        self, user: "User", month: int, year: int
+    ) -> list[Occurrence]:
         """
-        # current date
-        current_start, current_end = grid_range_for_month(year, month)
+        Occurrences inside the 42 tiles of a single month grid.
+        """
+        grid_start, grid_end = grid_range_for_month(year, month)
+        return self.filter_occurrences(user, grid_start, grid_end + timedelta(days=1))
 
-        # previous date
-        prev_year, prev_month = get_prev_month(year, month)
-        prev_start, prev_end = grid_range_for_month(prev_year, prev_month)
+    def filter_occurrences(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> list[Occurrence]:
+        """
+        Occurrences of the user's events overlapping [window_start, window_end),
+        sorted by occurrence start.
 
-        # next date
-        next_year, next_month = get_next_month(year, month)
-        next_start, next_end = grid_range_for_month(next_year, next_month)
+        Windows inside the occurrence horizon are read from the materialized
+        ``EventOccurrence`` table, anything else is expanded on the fly.
+        """
+        from apps.events.models import EventOccurrence
 
-        # calculate overall start and end dates
-        overall_start = min(prev_start, current_start, next_start)
-        overall_end = max(prev_end, current_end, next_end)
+        occurrences = EventOccurrence.objects.filter_window(
+            user=user,
+            window_start=window_start,
+            window_end=window_end,
+        )
+        if occurrences is not None:
+            return occurrences
 
-        # get events for the current month
+        # every event started before the window end may recur inside it,
+        # this is a range seek on the (user, start_datetime) index prefix
         events = self.filter(
             user=user,
-            start_datetime__gte=overall_start,
-            end_datetime__lte=overall_end,
-        ).order_by("start_datetime")
+            start_datetime__lt=window_end,
+        )
+
+        return expand_events(events, window_start, window_end)
+
+    async def afilter_calendar_month_events(
+        self, user: "User", month: int, year: int
+    ) -> list[Occurrence]:
+        """
+        Async ``filter_calendar_month_events``.
+        """
+        overall_start, overall_end = calendar_window_for_month(year, month)
+
+        return await self.afilter_occurrences(user, overall_start, overall_end)
+
+    async def afilter_occurrences(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> list[Occurrence]:
+        """
+        Async ``filter_occurrences``, the rows are read with the async ORM
+        and expanded the same way.
+        """
+        from apps.events.models import EventOccurrence
+
+        occurrences = await EventOccurrence.objects.afilter_window(
+            user=user,
+            window_start=window_start,
+            window_end=window_end,
+        )
+        if occurrences is not None:
+            return occurrences
+
+        events = [
+            event
+            async for event in self.filter(
+                user=user,
+                start_datetime__lt=window_end,
+            )
+        ]
+
+        return expand_events(events, window_start, window_end)
+
+    def span_rows(self, user_ids: list[uuid.UUID], window_end: datetime) -> QuerySet:
+        """
+        Only the span columns of the users' events that may occur before
+        ``window_end``, a range seek per user on the (user, start) index.
+        """
+        return self.filter(
+            user_id__in=user_ids, start_datetime__lt=window_end
+        ).values_list("user_id", "start_datetime", "end_datetime", "recurring_type")
+
+    def search(self, user: "User", query: str, limit: int) -> list["Event"]:
+        """
+        The user's events best matching ``query``, ranked with bm25 over the
+        FTS5 index. Matches carry ``name_snippet`` and ``description_snippet``
+        with the hits marked. Without the index a substring filter is used.
+        """
+        from apps.events import search
+
+        if search.is_available(self.db):
+            match = search.build_match(user.id, query)
+            if not match:
+                return []
+            return list(self.raw(search.SEARCH_SQL, [match, limit]))
+
+        return list(
+            self.filter(user=user)
+            .filter(Q(name__icontains=query) | Q(description__icontains=query))
+            .order_by("start_datetime")[:limit]
+        )
+
+    def find_overlapping_pairs(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> list[tuple[Occurrence, Occurrence]]:
+        """
+        Every pair of overlapping occurrences of different events inside
+        the window, found with one sweep over the occurrences sorted by start.
+        """
+        return [
+            (first, second)
+            for first, second in iter_overlapping_pairs(
+                self.filter_occurrences(user, window_start, window_end),
+                span=lambda occurrence: (
+                    occurrence.start_datetime,
+                    occurrence.end_datetime,
+                ),
+            )
+            if first.id != second.id
+        ]
+
+    def busy_intervals(
+        self, user_ids: list[uuid.UUID], window_start: datetime, window_end: datetime
+    ) -> dict[uuid.UUID, list[Interval]]:
+        """
+        Merged busy intervals of each user inside [window_start, window_end).
+
+        One query reads only the span columns of the users' events,
+        occurrences are expanded in memory, clipped to the window and
+        merged per user with a sort-and-sweep.
+        """
+        rows = self.span_rows(user_ids, window_end)
+
+        spans = {user_id: [] for user_id in user_ids}
+        for user_id, start, end, recurring_type in rows.iterator(
+            chunk_size=settings.EVENTS["CHUNK_SIZE"]
+        ):
+            spans[user_id].extend(
+                (max(occurrence_start, window_start), min(occurrence_end, window_end))
+                for occurrence_start, occurrence_end in iter_occurrence_spans(
+                    start=start,
+                    end=end,
+                    recurring_type=recurring_type,
+                    window_start=window_start,
+                    window_end=window_end,
+                )
+            )
+        return {user_id: merge_intervals(items) for user_id, items in spans.items()}
+
+    def find_free_slots(
+        self,
+        user_ids: list[uuid.UUID],
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta,
+        limit: int,
+        work_start: Optional[time] = None,
+        work_end: Optional[time] = None,
+    ) -> list[Interval]:
+        """
+        The earliest ``limit`` free intervals of at least ``duration`` that
+        all users share, optionally within daily working hours.
+
+        Every event contributes its own lazily expanded, sorted stream of
+        occurrences to one k-way sweep, which stops at the last slot needed.
+        """
+        busy = [
+            iter_occurrence_spans(
+                start=start,
+                end=end,
+                recurring_type=recurring_type,
+                window_start=window_start,
+                window_end=window_end,
+            )
+            for _user_id, start, end, recurring_type in self.span_rows(
+                user_ids, window_end
+            )
+        ]
+        if work_start is not None and work_end is not None:
+            busy.append(iter_off_hours(window_start, window_end, work_start, work_end))
+
+        slots = iter_free_slots(busy, window_start, window_end, duration)
+        return list(islice(slots, limit))
+
+
+class EventOccurrenceManager(models.Manager):
+    def build_occurrences(
+        self,
+        events: Iterable["Event"],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> list["EventOccurrence"]:
+        """
+        Unsaved occurrences of the events starting inside [window_start, window_end).
+        Rows are keyed by their start, so consecutive windows never overlap.
+        """
+        occurrences = []
+        for event in events:
+            for start, end in iter_occurrence_spans(
+                start=event.start_datetime,
+                end=event.end_datetime,
+                recurring_type=event.recurring_type,
+                window_start=window_start,
+                window_end=window_end,
+            ):
+                if start < window_start:
+                    continue
+                occurrences.append(
+                    self.model(
+                        event_id=event.id,
+                        user_id=event.user_id,
+                        start_datetime=start,
+                        end_datetime=end,
+                    )
+                )
+        return occurrences
+
+    def refresh_event_occurrences(
+        self, events: list["Event"], created: bool = False
+    ) -> None:
+        """
+        Recompute the materialized occurrences of the given events only.
+        Freshly created events have nothing to delete first.
+
+        The horizon row stays locked until the write commits, so a
+        concurrent ``extend_horizon`` either waits and then sees the
+        written events, or has already moved the horizon read here.
+        """
+        from apps.events.models import OccurrenceHorizon
+
+        with transaction.atomic():
+            horizon = OccurrenceHorizon.objects.lock_horizon()
+            if horizon is None:
+                return
+            if not created:
+                self.filter(event_id__in=[event.id for event in events]).delete()
+            self.bulk_create(
+                self.build_occurrences(
+                    events=events,
+                    window_start=horizon.materialized_from,
+                    window_end=horizon.materialized_until,
+                ),
+                batch_size=settings.EVENTS["CHUNK_SIZE"],
+            )
+
+    @staticmethod
+    def covers(
+        horizon: Optional["OccurrenceHorizon"],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> bool:
+        lowest_start = window_start - settings.EVENTS["MAX_DURATION"]
+        return horizon is not None and horizon.covers(lowest_start, window_end)
+
+    def window_rows(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> QuerySet["EventOccurrence"]:
+        lowest_start = window_start - settings.EVENTS["MAX_DURATION"]
+        return (
+            self.filter(
+                user=user,
+                start_datetime__gt=lowest_start,
+                start_datetime__lt=window_end,
+                end_datetime__gt=window_start,
+            )
+            .select_related("event")
+            .order_by("start_datetime")
+        )
+
+    @staticmethod
+    def to_occurrence(row: "EventOccurrence") -> Occurrence:
+        return Occurrence(
+            event=row.event,
+            start_datetime=row.start_datetime,
+            end_datetime=row.end_datetime,
+        )
+
+    def filter_window(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> Optional[list[Occurrence]]:
+        """
+        Materialized occurrences overlapping [window_start, window_end),
+        or None when the window is not fully inside the occurrence horizon.
+        """
+        from apps.events.models import OccurrenceHorizon
+
+        horizon = OccurrenceHorizon.objects.get_horizon()
+        if not self.covers(horizon, window_start, window_end):
+            return None
+
+        rows = self.window_rows(user, window_start, window_end)
+        return [self.to_occurrence(row) for row in rows]
+
+    async def afilter_window(
+        self, user: "User", window_start: datetime, window_end: datetime
+    ) -> Optional[list[Occurrence]]:
+        """
+        Async ``filter_window``.
+        """
+        from apps.events.models import OccurrenceHorizon
+
+        horizon = await OccurrenceHorizon.objects.aget_horizon()
+        if not self.covers(horizon, window_start, window_end):
+            return None
+
+        rows = self.window_rows(user, window_start, window_end)
+        return [self.to_occurrence(row) async for row in rows]
+
+    def extend_horizon(self) -> "OccurrenceHorizon":
+        """
+        Move the occurrence horizon forward to ``now + OCCURRENCE_HORIZON``,
+        materializing only the newly covered range, and drop occurrences
+        older than ``now - OCCURRENCE_HISTORY``.
+        """
+        from apps.events.models import Event, OccurrenceHorizon
+
+        now = timezone.now()
+        materialized_from = now - settings.EVENTS["OCCURRENCE_HISTORY"]
+        materialized_until = now + settings.EVENTS["OCCURRENCE_HORIZON"]
+
+        with transaction.atomic():
+            horizon = OccurrenceHorizon.objects.lock_horizon()
+            if horizon is None:
+                horizon = OccurrenceHorizon(
+                    materialized_from=materialized_from,
+                    materialized_until=materialized_from,
+                )
+            else:
+                materialized_from = max(materialized_from, horizon.materialized_from)
+
+            fill_from = horizon.materialized_until
+            if materialized_until > fill_from:
+                events = Event.objects.filter(start_datetime__lt=materialized_until)
+                chunk = []
+                for event in events.iterator(chunk_size=settings.EVENTS["CHUNK_SIZE"]):
+                    chunk.append(event)
+                    if len(chunk) >= settings.EVENTS["CHUNK_SIZE"]:
+                        self.bulk_create(
+                            self.build_occurrences(chunk, fill_from, materialized_until)
+                        )
+                        chunk = []
+                self.bulk_create(
+                    self.build_occurrences(chunk, fill_from, materialized_until)
+                )
+                horizon.materialized_until = materialized_until
+
+            self.filter(start_datetime__lt=materialized_from).delete()
+            horizon.materialized_from = materialized_from
+            horizon.save()
+
+        logger.info(
+            f"Occurrence horizon extended to {horizon.materialized_from} - "
+            f"{horizon.materialized_until}."
+        )
+        return horizon
+
+
+class EventTombstoneManager(models.Manager):
+    def record(
+        self, user_id: uuid.UUID, event_ids: list[uuid.UUID], change_number: int
+    ) -> None:
+        deleted_at = timezone.now()
+        self.bulk_create(
+            [
+                self.model(
+                    event_id=event_id,
+                    user_id=user_id,
+                    deleted_at=deleted_at,
+                    change_number=change_number,
+                )
+                for event_id in event_ids
+            ],
+            batch_size=settings.EVENTS["CHUNK_SIZE"],
+        )
+
+    def prune(self) -> int:
+        """
+        Drop tombstones older than the retention, tokens issued before
+        it are answered with a full resync instead.
+        """
+        cutoff = timezone.now() - settings.EVENTS["TOMBSTONE_RETENTION"]
+        deleted, _rows = self.filter(deleted_at__lt=cutoff).delete()
+        logger.info(f"Pruned {deleted} event tombstones older than {cutoff}.")
+        return deleted
+
+
+class OccurrenceHorizonManager(models.Manager):
+    def get_horizon(self) -> Optional["OccurrenceHorizon"]:
+        return self.first()
+
+    def lock_horizon(self) -> Optional["OccurrenceHorizon"]:
+        """
+        The horizon locked until the surrounding transaction ends.
+        """
+        return self.select_for_update().first()
 
-        return events
+    async def aget_horizon(self) -> Optional["OccurrenceHorizon"]:
+        return await self.afirst()
@@ -0,0 +1,92 @@
+import hashlib
+import uuid
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+
+from apps.users.models import User
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETags derived from the user's events version.
+
+    The version is read before anything else, so an unchanged calendar
+    is answered with 304 without running the query or the serializer.
+    Handlers find it in ``events_version`` to key what they cache.
+    """
+
+    events_version: int = 0
+
+    @staticmethod
+    def make_etag(request, version: int, renderer_format: str) -> str:
+        key = ":".join(
+            [
+                str(request.user.id),
+                str(version),
+                renderer_format,
+                request.get_full_path(),
+            ]
+        )
+        return quote_etag(hashlib.sha256(key.encode()).hexdigest())
+
+    def get_etag(self, request) -> str:
+        version = self.events_version = User.objects.get_events_version(request.user.id)
+        return self.make_etag(request, version, request.accepted_renderer.format)
+
+    def conditional_get(self, handler, request, *args, **kwargs):
+        etag = self.get_etag(request)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """
+    ``ConditionalGetMixin`` for async Django views answering JSON.
+    """
+
+    async def aget_etag(self, request) -> str:
+        version = self.events_version = await User.objects.aget_events_version(
+            request.user.id
+        )
+        return self.make_etag(request, version, "json")
+
+    async def aconditional_get(self, handler, request, *args, **kwargs):
+        etag = await self.aget_etag(request)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = await handler(request, *args, **kwargs)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class UserGroupMixin:
+    """
+    Views reading the busy time of the ``users`` parameter. Calendars are
+    not shared, so a user may only ask about themselves; staff about
+    anyone.
+    """
+
+    def get_user_ids(self, validated_data: dict) -> list[uuid.UUID]:
+        user = self.request.user
+        user_ids = validated_data.get("users") or [user.id]
+        if not user.is_staff and any(user_id != user.id for user_id in user_ids):
+            raise PermissionDenied("Only staff can read other users' busy time.")
+        return user_ids
@@ -2,9 +2,15 @@ import uuid
 from datetime import datetime
 
 from django.db import models
+from django.utils import timezone
 
 from apps.events.enums import RecurringType
-from apps.events.managers import EventManager
+from apps.events.managers import (
+    EventManager,
+    EventOccurrenceManager,
+    EventTombstoneManager,
+    OccurrenceHorizonManager,
+)
 
 
 class Event(models.Model):
@@ -28,6 +34,10 @@ class Event(models.Model):
         on_delete=models.CASCADE,
         related_name="events",
     )
+    # set on every write, bulk .update() calls set it explicitly
+    updated_at = models.DateTimeField(auto_now=True)
+    # the user's events version of the last write, orders the delta sync
+    change_number = models.PositiveBigIntegerField(default=0, editable=False)
 
     objects = EventManager()
 
@@ -41,7 +51,130 @@ class Event(models.Model):
                 name="unique_event_name_per_user",
             )
         ]
-        indexes = [models.Index(fields=["start_datetime", "end_datetime"])]
+        indexes = [
+            models.Index(
+                fields=["user", "start_datetime", "end_datetime"],
+                name="events_user_start_end_idx",
+            ),
+            # backs keyset pagination ordered by (start_datetime, id)
+            models.Index(
+                fields=["user", "start_datetime", "id"],
+                name="events_user_start_id_idx",
+            ),
+            # backs the delta sync of changes since a token
+            models.Index(
+                fields=["user", "change_number"],
+                name="events_user_change_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Event: {self.name}"
+
+
+# the indexes leading with (user, start_datetime), the calendar lookups
+# seek on either, whichever the planner picks
+EVENT_TIME_INDEXES = tuple(
+    index.name
+    for index in Event._meta.indexes
+    if index.fields[:2] == ["user", "start_datetime"]
+)
+
+
+class EventTombstone(models.Model):
+    """
+    Marker left by a deleted event so delta sync can report the deletion.
+    """
+
+    event_id = models.UUIDField()
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="event_tombstones",
+    )
+    deleted_at = models.DateTimeField(default=timezone.now)
+    # the user's events version of the deletion, orders the delta sync
+    change_number = models.PositiveBigIntegerField(default=0)
+
+    objects = EventTombstoneManager()
+
+    class Meta:
+        verbose_name = "event tombstone"
+        verbose_name_plural = "event tombstones"
+        db_table = "event_tombstones"
+        indexes = [
+            # backs the delta sync of deletions since a token
+            models.Index(
+                fields=["user", "change_number"],
+                name="tombstones_user_change_idx",
+            ),
+            # backs pruning by age
+            models.Index(
+                fields=["deleted_at"],
+                name="tombstones_deleted_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Tombstone: {self.event_id} at {self.deleted_at}"
+
+
+class EventOccurrence(models.Model):
+    """
+    Materialized occurrence of an event inside the occurrence horizon.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="event_occurrences",
+    )
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+
+    objects = EventOccurrenceManager()
+
+    class Meta:
+        verbose_name = "event occurrence"
+        verbose_name_plural = "event occurrences"
+        db_table = "event_occurrences"
+        indexes = [
+            models.Index(
+                fields=["user", "start_datetime", "end_datetime"],
+                name="occurrences_user_start_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"Occurrence: {self.event_id} at {self.start_datetime}"
+
+
+class OccurrenceHorizon(models.Model):
+    """
+    Single row describing the [materialized_from, materialized_until) range
+    for which ``EventOccurrence`` holds every occurrence of every event.
+    """
+
+    materialized_from = models.DateTimeField()
+    materialized_until = models.DateTimeField()
+
+    objects = OccurrenceHorizonManager()
+
+    class Meta:
+        verbose_name = "occurrence horizon"
+        verbose_name_plural = "occurrence horizon"
+        db_table = "occurrence_horizon"
+
+    def __str__(self):
+        return f"Occurrences: {self.materialized_from} - {self.materialized_until}"
+
+    def covers(self, window_start: datetime, window_end: datetime) -> bool:
+        return (
+            self.materialized_from <= window_start
+            and window_end <= self.materialized_until
+        )
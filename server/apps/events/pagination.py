@@ -0,0 +1,161 @@
+import uuid
+from base64 import b64decode, b64encode
+from datetime import datetime
+from typing import NamedTuple, Optional
+from urllib import parse
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class EventCursor(NamedTuple):
+    reverse: bool
+    start_datetime: datetime
+    id: uuid.UUID
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (start_datetime, id).
+
+    The stock CursorPagination keeps only the first ordering field in the
+    cursor and skips ties with an offset. Here the cursor holds both keys,
+    so every page is one seek on the (user, start_datetime, id) index,
+    whatever its depth.
+
+    Paging is opt-in: without ``?page_size=`` or ``?cursor=`` the list is
+    answered as a plain array of every event, as clients written before
+    pagination expect.
+    """
+
+    ordering = ("start_datetime", "id")
+    page_size = settings.EVENTS["PAGE_SIZE"]
+    page_size_query_param = "page_size"
+    max_page_size = settings.EVENTS["MAX_PAGE_SIZE"]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.seek(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset[: self.page_size + 1]))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        ``paginate_queryset`` reading the page with the async ORM.
+        ``request`` is a DRF ``Request`` wrapping the Django request.
+        """
+        queryset = self.seek(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page([row async for row in queryset[: self.page_size + 1]])
+
+    def get_page_size(self, request) -> Optional[int]:
+        params = request.query_params
+        if (
+            self.page_size_query_param not in params
+            and self.cursor_query_param not in params
+        ):
+            return None
+        return super().get_page_size(request)
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def seek(self, queryset, request) -> Optional[QuerySet]:
+        """
+        The queryset ordered and filtered past the requested cursor,
+        or None when pagination is off.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = cursor = self.decode_cursor(request)
+        reverse = cursor.reverse if cursor else False
+
+        if reverse:
+            queryset = queryset.order_by("-start_datetime", "-id")
+        else:
+            queryset = queryset.order_by("start_datetime", "id")
+
+        if cursor is not None:
+            if reverse:
+                queryset = queryset.filter(
+                    Q(start_datetime__lt=cursor.start_datetime) | Q(id__lt=cursor.id),
+                    start_datetime__lte=cursor.start_datetime,
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(start_datetime__gt=cursor.start_datetime) | Q(id__gt=cursor.id),
+                    start_datetime__gte=cursor.start_datetime,
+                )
+        return queryset
+
+    def set_page(self, results: list) -> list:
+        cursor = self.cursor
+        reverse = cursor.reverse if cursor else False
+        has_following = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        if reverse:
+            self.has_next = cursor is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = cursor is not None
+
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        last = self.page[-1]
+        return self.encode_cursor(
+            EventCursor(reverse=False, start_datetime=last.start_datetime, id=last.id)
+        )
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        first = self.page[0]
+        return self.encode_cursor(
+            EventCursor(reverse=True, start_datetime=first.start_datetime, id=first.id)
+        )
+
+    def decode_cursor(self, request) -> Optional[EventCursor]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            return EventCursor(
+                reverse=bool(int(tokens.get("r", ["0"])[0])),
+                start_datetime=datetime.fromisoformat(tokens["s"][0]),
+                id=uuid.UUID(tokens["i"][0]),
+            )
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor: EventCursor) -> str:
+        tokens = {
+            "s": cursor.start_datetime.isoformat(),
+            "i": cursor.id.hex,
+        }
+        if cursor.reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
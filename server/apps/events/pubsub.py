@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+Message = dict[str, Any]
+Handler = Callable[[str, Message], None]
+
+
+class LocalBackend:
+    """
+    Fan-out inside this process only.
+
+    Stand-in for a cross-worker backend (e.g. Redis PUBLISH/SUBSCRIBE):
+    a backend publishes messages on a channel and hands every message
+    published by any worker to the registered handlers.
+    """
+
+    def __init__(self):
+        self.handlers: list[Handler] = []
+
+    def publish(self, channel: str, message: Message) -> None:
+        for handler in self.handlers:
+            handler(channel, message)
+
+    def listen(self, handler: Handler) -> None:
+        self.handlers.append(handler)
+
+
+class Subscription:
+    """
+    The queue of one connected client, living on that client's event loop.
+
+    When a slow client lets the queue fill up, pending messages are
+    replaced by a single ``reset`` telling it to resync.
+    """
+
+    def __init__(self, channel: str, maxsize: int):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[Message] = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, message: Message) -> None:
+        # publishers run in worker threads, the queue belongs to the loop
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # the loop is closed, the client is gone
+            pass
+
+    def _put(self, message: Message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "reset"})
+
+    async def get(self, timeout: float) -> Optional[Message]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broker:
+    """
+    Per-user channels of event change notifications.
+    """
+
+    def __init__(self, backend, queue_size: int):
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscriptions: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        backend.listen(self.deliver)
+
+    @staticmethod
+    def channel(user_id: uuid.UUID) -> str:
+        return f"events:{user_id}"
+
+    def publish(self, user_id: uuid.UUID, message: Message) -> None:
+        self.backend.publish(self.channel(user_id), message)
+
+    def deliver(self, channel: str, message: Message) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.put(message)
+
+    def subscribe(self, user_id: uuid.UUID) -> Subscription:
+        """
+        Must be called from the event loop that will read the subscription.
+        """
+        subscription = Subscription(self.channel(user_id), maxsize=self.queue_size)
+        with self._lock:
+            self._subscriptions[subscription.channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._subscriptions.values())
+
+
+broker = Broker(
+    backend=import_string(settings.EVENTS["PUBSUB_BACKEND"])(),
+    queue_size=settings.EVENTS["STREAM_QUEUE_SIZE"],
+)
@@ -0,0 +1,160 @@
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.utils import timezone
+
+from apps.events.enums import RecurringType
+
+if TYPE_CHECKING:
+    from apps.events.models import Event
+
+
+FIXED_PERIODS = {
+    RecurringType.DAILY.value: timedelta(days=1),
+    RecurringType.WEEKLY.value: timedelta(weeks=1),
+}
+
+MONTH_STEPS = {
+    RecurringType.MONTHLY.value: 1,
+    RecurringType.YEARLY.value: 12,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Occurrence:
+    """
+    A single occurrence of a (possibly recurring) event.
+
+    It exposes the same attributes as ``Event`` so it can be passed
+    to ``EventSerializer`` without touching the database again.
+    """
+
+    event: "Event"
+    start_datetime: datetime
+    end_datetime: datetime
+
+    @property
+    def id(self):
+        return self.event.id
+
+    @property
+    def name(self) -> str:
+        return self.event.name
+
+    @property
+    def description(self) -> str:
+        return self.event.description
+
+    @property
+    def recurring_type(self) -> str:
+        return self.event.recurring_type
+
+    @property
+    def user(self):
+        return self.event.user
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """
+    Shift a datetime by a number of months, clamping the day to the
+    last day of the target month (e.g. Jan 31 + 1 month -> Feb 28).
+    """
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def months_between(start: datetime, end: datetime) -> int:
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
+def iter_occurrence_spans(
+    start: datetime,
+    end: datetime,
+    recurring_type: str,
+    window_start: datetime,
+    window_end: datetime,
+) -> Iterator[tuple[datetime, datetime]]:
+    """
+    Yield (start, end) pairs of every occurrence overlapping the window
+    [window_start, window_end).
+
+    The first candidate occurrence is computed with date arithmetic,
+    so the cost depends on the number of occurrences inside the window,
+    not on how long ago the event started.
+    """
+    if start >= window_end:
+        return
+
+    if recurring_type not in FIXED_PERIODS and recurring_type not in MONTH_STEPS:
+        if end > window_start:
+            yield start, end
+        return
+
+    # recurrences follow the wall clock, so do the arithmetic in local time
+    # and hand the results back in the timezone they were stored in
+    tzinfo = start.tzinfo
+    start = timezone.localtime(start)
+    duration = end - start
+
+    if recurring_type in FIXED_PERIODS:
+        period = FIXED_PERIODS[recurring_type]
+        index = max(0, (window_start - start - duration) // period)
+
+        def shift(n: int) -> datetime:
+            return start + n * period
+
+    else:
+        step = MONTH_STEPS[recurring_type]
+        first_end = timezone.localtime(window_start - duration)
+        index = max(0, months_between(start, first_end) // step - 1)
+
+        def shift(n: int) -> datetime:
+            return add_months(start, n * step)
+
+    # the jump may land one period short (DST, month lengths), catch up here
+    occurrence_start = shift(index)
+    while occurrence_start + duration <= window_start:
+        index += 1
+        occurrence_start = shift(index)
+
+    while occurrence_start < window_end:
+        yield (
+            occurrence_start.astimezone(tzinfo),
+            (occurrence_start + duration).astimezone(tzinfo),
+        )
+        index += 1
+        occurrence_start = shift(index)
+
+
+def expand_event(
+    event: "Event", window_start: datetime, window_end: datetime
+) -> list[Occurrence]:
+    return [
+        Occurrence(event=event, start_datetime=start, end_datetime=end)
+        for start, end in iter_occurrence_spans(
+            start=event.start_datetime,
+            end=event.end_datetime,
+            recurring_type=event.recurring_type,
+            window_start=window_start,
+            window_end=window_end,
+        )
+    ]
+
+
+def expand_events(
+    events: Iterable["Event"], window_start: datetime, window_end: datetime
+) -> list[Occurrence]:
+    """
+    Expand every event into its occurrences inside the window,
+    sorted by occurrence start.
+    """
+    occurrences = []
+    for event in events:
+        occurrences.extend(expand_event(event, window_start, window_end))
+    occurrences.sort(key=lambda occurrence: occurrence.start_datetime)
+    return occurrences
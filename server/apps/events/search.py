@@ -0,0 +1,142 @@
+import logging
+import re
+from typing import Optional
+
+from django.db import connections
+from django.db.utils import OperationalError
+from django.utils.html import escape
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "events_fts"
+
+# event_id and user_id are indexed as single tokens, so deletes and the
+# per-user scope are posting list lookups instead of scans
+FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        event_id, user_id, name, description, tokenize = 'unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events
+    BEGIN
+        INSERT INTO {FTS_TABLE} (event_id, user_id, name, description)
+        VALUES (new.id, new.user_id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events
+    BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid IN (
+            SELECT rowid FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH 'event_id:"' || old.id || '"'
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS events_fts_update
+    AFTER UPDATE OF name, description, user_id ON events
+    BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid IN (
+            SELECT rowid FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH 'event_id:"' || old.id || '"'
+        );
+        INSERT INTO {FTS_TABLE} (event_id, user_id, name, description)
+        VALUES (new.id, new.user_id, new.name, new.description);
+    END
+    """,
+]
+
+# control characters never stored in event text, turned into <mark> after escaping
+MARK_START, MARK_END = "\x02", "\x03"
+
+# column weights for bm25: event_id, user_id, name, description
+RANK = f"bm25({FTS_TABLE}, 0.0, 0.0, 10.0, 1.0)"
+
+SEARCH_SQL = f"""
+    SELECT
+        events.id, events.name, events.description, events.recurring_type,
+        events.start_datetime, events.end_datetime, events.user_id,
+        snippet({FTS_TABLE}, 2, '{MARK_START}', '{MARK_END}', '…', 8) AS name_snippet,
+        snippet({FTS_TABLE}, 3, '{MARK_START}', '{MARK_END}', '…', 16)
+            AS description_snippet
+    FROM {FTS_TABLE}
+    JOIN events ON events.id = {FTS_TABLE}.event_id
+    WHERE {FTS_TABLE} MATCH %s
+    ORDER BY {RANK}
+    LIMIT %s
+"""
+
+_available = set()
+
+
+def is_available(using: str = "default") -> bool:
+    """
+    Whether the full-text index exists on the database, remembered once found.
+    """
+    if using in _available:
+        return True
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [FTS_TABLE],
+        )
+        if cursor.fetchone() is None:
+            return False
+    _available.add(using)
+    return True
+
+
+def install(using: str = "default") -> None:
+    """
+    Create the FTS5 table and its triggers, filling it from the events
+    table the first time. Databases without FTS5 keep the fallback search.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+
+    created = not is_available(using)
+    try:
+        with connection.cursor() as cursor:
+            for statement in FTS_SCHEMA:
+                cursor.execute(statement)
+            if created:
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE} (event_id, user_id, name, description) "
+                    "SELECT id, user_id, name, description FROM events"
+                )
+                logger.info(f"Built the {FTS_TABLE} full-text index.")
+    except OperationalError as error:
+        logger.warning(f"Full-text search is not available: {error}")
+        return
+    _available.add(using)
+
+
+def install_on_migrate(sender, using: str = "default", **kwargs) -> None:
+    install(using)
+
+
+def build_match(user_id, query: str) -> str:
+    """
+    An FTS5 query matching every word of ``query`` as a prefix inside
+    name or description, restricted to one user. Words are quoted, so
+    user input never reaches the FTS5 query syntax.
+    """
+    words = " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+    if not words:
+        return ""
+    return f'user_id:"{user_id.hex}" AND {{name description}}: ({words})'
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """
+    HTML-escape a snippet and wrap its hits in ``<mark>``.
+    """
+    if snippet is None:
+        return None
+    return escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
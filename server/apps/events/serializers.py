@@ -1,7 +1,10 @@
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Iterable
 
+from django.conf import settings
 from django.db import transaction
-from django.utils.timezone import get_current_timezone, make_aware
+from django.utils.timezone import get_current_timezone, localtime, make_aware
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema_field
 from rest_framework import serializers, status
@@ -36,6 +39,11 @@ class EventSerializer(serializers.ModelSerializer):
         write_only=True,
         required=True,
     )
+    # opt-in, rejects the event if it overlaps another one of the user
+    check_conflicts = serializers.BooleanField(
+        default=False,
+        write_only=True,
+    )
 
     class Meta:
         model = Event
@@ -48,6 +56,7 @@ class EventSerializer(serializers.ModelSerializer):
             "start_time",
             "end_date",
             "end_time",
+            "check_conflicts",
             # nested fields
             "user",
         ]
@@ -57,15 +66,23 @@ class EventSerializer(serializers.ModelSerializer):
 
     def to_internal_value(self, data):
         data = super().to_internal_value(data)
-        data["start_datetime"] = make_aware(
-            datetime.combine(data["start_date"], data["start_time"]),
-            timezone=get_current_timezone(),
-        )
-        data["end_datetime"] = make_aware(
-            datetime.combine(data["end_date"], data["end_time"]),
+        data["start_datetime"] = self.combine(data, "start")
+        data["end_datetime"] = self.combine(data, "end")
+        return data
+
+    def combine(self, data: dict, prefix: str) -> datetime:
+        """
+        The date and time fields as one aware datetime. A partial update
+        takes the parts it leaves out from the event.
+        """
+        if self.partial and self.instance is not None:
+            current = localtime(getattr(self.instance, f"{prefix}_datetime"))
+            data.setdefault(f"{prefix}_date", current.date())
+            data.setdefault(f"{prefix}_time", current.time())
+        return make_aware(
+            datetime.combine(data[f"{prefix}_date"], data[f"{prefix}_time"]),
             timezone=get_current_timezone(),
         )
-        return data
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -78,6 +95,7 @@ class EventSerializer(serializers.ModelSerializer):
     def validate_recurring_type(self, value):  # noqa
         if value not in RecurringType.values():
             raise serializers.ValidationError("Invalid recurring type.")
+        return value
 
     def validate(self, attrs):
         if attrs["start_datetime"] > attrs["end_datetime"]:
@@ -86,6 +104,14 @@ class EventSerializer(serializers.ModelSerializer):
                 code=status.HTTP_400_BAD_REQUEST,
             )
 
+        if (
+            attrs["end_datetime"] - attrs["start_datetime"]
+            > settings.EVENTS["MAX_DURATION"]
+        ):
+            raise serializers.ValidationError(
+                f"Event can not last longer than {settings.EVENTS['MAX_DURATION']}."
+            )
+
         if attrs["start_datetime"] < datetime.now(tz=get_current_timezone()):
             raise serializers.ValidationError("Start datetime should be in the future.")
 
@@ -103,19 +129,20 @@ class EventSerializer(serializers.ModelSerializer):
                 recurring_type=validated_data["recurring_type"],
                 start_datetime=validated_data["start_datetime"],
                 end_datetime=validated_data["end_datetime"],
-                **validated_data,
+                check_conflicts=validated_data.get("check_conflicts", False),
             )
             return event
         except Exception as error:
             raise serializers.ValidationError(error)
 
     def update(self, instance, validated_data):
-        user = validated_data.pop("user", None)
+        # partial updates skip the hidden field's default
+        user = validated_data.pop("user", None) or self.context["request"].user
         if not user:
             raise serializers.ValidationError("User is required.")
         try:
             event = Event.objects.update_event(
-                instance=instance,
+                event_id=instance.id,
                 user=user,
                 name=validated_data.get("name", instance.name),
                 description=validated_data.get("description", instance.description),
@@ -126,8 +153,249 @@ class EventSerializer(serializers.ModelSerializer):
                     "start_datetime", instance.start_datetime
                 ),
                 end_datetime=validated_data.get("end_datetime", instance.end_datetime),
-                **validated_data,
+                check_conflicts=validated_data.get("check_conflicts", False),
             )
             return event
         except Exception as error:
             raise serializers.ValidationError(error)
+
+
+class EventBulkItemSerializer(EventSerializer):
+    """
+    Validates one item of a bulk request. Name uniqueness is checked once
+    for the whole batch by ``EventManager.bulk_create_events``, so the
+    per-item unique together query is dropped.
+    """
+
+    class Meta(EventSerializer.Meta):
+        validators = []
+
+    def validate_check_conflicts(self, value):  # noqa
+        # bulk_create_events writes the batch without conflict checks
+        if value:
+            raise serializers.ValidationError(
+                "Conflict checks are not supported in bulk requests."
+            )
+        return value
+
+
+class EventBulkFilterSerializer(serializers.Serializer):
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    recurring_type = serializers.ChoiceField(
+        choices=RecurringType.values(), required=False
+    )
+
+
+class EventBulkSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.EVENTS["MAX_BULK_SIZE"],
+    )
+    filter = EventBulkFilterSerializer(required=False)
+
+    def validate(self, attrs):
+        if "ids" not in attrs and not attrs.get("filter"):
+            raise serializers.ValidationError("Select events by ids or filter.")
+        return attrs
+
+    def get_selection(self) -> dict:
+        """
+        Keyword arguments for ``EventManager.filter_selection``.
+        """
+        selection = self.validated_data.get("filter", {})
+        return {
+            "ids": self.validated_data.get("ids"),
+            "start_datetime": selection.get("start"),
+            "end_datetime": selection.get("end"),
+            "recurring_type": selection.get("recurring_type"),
+        }
+
+
+class EventBulkChangesSerializer(serializers.Serializer):
+    description = serializers.CharField(max_length=1000, required=False)
+    recurring_type = serializers.ChoiceField(
+        choices=RecurringType.values(), required=False
+    )
+    shift_minutes = serializers.IntegerField(required=False)
+
+
+class EventBulkUpdateSerializer(EventBulkSelectionSerializer):
+    changes = EventBulkChangesSerializer()
+
+    def validate_changes(self, value):  # noqa
+        if not value:
+            raise serializers.ValidationError("No changes given.")
+        return value
+
+
+class EventWindowSerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def validate(self, attrs):
+        if attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError("Start should be earlier than end.")
+        if attrs["end"] - attrs["start"] > settings.EVENTS["MAX_WINDOW"]:
+            raise serializers.ValidationError(
+                f"Window can not be longer than {settings.EVENTS['MAX_WINDOW']}."
+            )
+        return attrs
+
+
+class FreeBusySerializer(EventWindowSerializer):
+    # comma separated user ids, the requesting user when omitted
+    users = serializers.CharField(required=False)
+
+    def validate_users(self, value):  # noqa
+        try:
+            user_ids = list(
+                dict.fromkeys(uuid.UUID(item) for item in value.split(",") if item)
+            )
+        except ValueError:
+            raise serializers.ValidationError("Expected comma separated user ids.")
+        if len(user_ids) > settings.EVENTS["MAX_FREEBUSY_USERS"]:
+            raise serializers.ValidationError(
+                f"At most {settings.EVENTS['MAX_FREEBUSY_USERS']} users per request."
+            )
+        return user_ids
+
+
+class IntervalSerializer(serializers.Serializer):
+    """
+    Output of ``(start, end)`` pairs, rendered in the current timezone.
+    """
+
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def to_representation(self, instance):
+        start, end = instance
+        return super().to_representation({"start": start, "end": end})
+
+
+class SlotFinderSerializer(FreeBusySerializer):
+    duration = serializers.IntegerField(
+        min_value=1, help_text="Length of the meeting in minutes."
+    )
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.EVENTS["MAX_SLOTS"], default=5
+    )
+    # local wall-clock bounds of each day, the whole day when omitted
+    work_start = serializers.TimeField(required=False)
+    work_end = serializers.TimeField(required=False)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        work_start, work_end = attrs.get("work_start"), attrs.get("work_end")
+        if (work_start is None) != (work_end is None):
+            raise serializers.ValidationError(
+                "Working hours need both work_start and work_end."
+            )
+        if work_start is not None and work_start >= work_end:
+            raise serializers.ValidationError(
+                "Start of working hours should be earlier than their end."
+            )
+        attrs["duration"] = timedelta(minutes=attrs["duration"])
+        return attrs
+
+
+class EventSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.EVENTS["MAX_SEARCH_RESULTS"], default=20
+    )
+
+
+class EventAutocompleteSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255, trim_whitespace=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.EVENTS["MAX_SEARCH_RESULTS"], default=10
+    )
+
+
+class EventImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    # taken from the file extension when omitted
+    type = serializers.ChoiceField(choices=["ics", "csv"], required=False)
+
+    def validate(self, attrs):
+        if "type" not in attrs:
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in ("ics", "csv"):
+                raise serializers.ValidationError(
+                    {"type": ["Can not tell the file type, pass ics or csv."]}
+                )
+            attrs["type"] = extension
+        return attrs
+
+
+class EventReadSerializer:
+    """
+    Read-only fast path producing exactly the output of
+    ``EventSerializer.to_representation``.
+
+    It skips the field machinery of ModelSerializer (write-only date/time
+    fields, the hidden user) and formats dates without ``strftime``.
+    Works with ``Event`` and ``Occurrence`` instances and with named rows
+    from ``values_list(*EventReadSerializer.fields, named=True)``.
+    """
+
+    fields = (
+        "id",
+        "name",
+        "description",
+        "recurring_type",
+        "start_datetime",
+        "end_datetime",
+    )
+
+    # "00".."59" for hours, minutes and seconds
+    padded = tuple(f"{number:02d}" for number in range(60))
+    # "%Y-%m-%d" strings by date ordinal, calendars reuse few distinct days
+    dates: dict[int, str] = {}
+    max_dates = 100_000
+
+    @classmethod
+    def format_date(cls, value: datetime) -> str:
+        ordinal = value.toordinal()
+        try:
+            return cls.dates[ordinal]
+        except KeyError:
+            if len(cls.dates) >= cls.max_dates:
+                cls.dates.clear()
+            formatted = cls.dates[ordinal] = value.date().isoformat()
+            return formatted
+
+    @classmethod
+    def format_time(cls, value: datetime) -> str:
+        padded = cls.padded
+        return f"{padded[value.hour]}:{padded[value.minute]}:{padded[value.second]}"
+
+    @classmethod
+    def to_representation(cls, instance: Any) -> dict[str, Any]:
+        start_datetime = instance.start_datetime
+        end_datetime = instance.end_datetime
+        return {
+            "id": str(instance.id),
+            "name": str(instance.name),
+            "description": str(instance.description),
+            "recurring_type": instance.recurring_type,
+            "start_date": cls.format_date(start_datetime),
+            "end_date": cls.format_date(end_datetime),
+            "start_time": cls.format_time(start_datetime),
+            "end_time": cls.format_time(end_datetime),
+        }
+
+    @classmethod
+    def many(cls, instances: Iterable[Any]) -> list[dict[str, Any]]:
+        return [cls.to_representation(instance) for instance in instances]
+
+    @classmethod
+    def rows(cls, queryset):
+        """
+        Only the columns needed for the representation, as named rows.
+        """
+        return queryset.values_list(*cls.fields, named=True)
@@ -0,0 +1,86 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+# flush the buffer to the client once it grows past this many bytes
+BUFFER_SIZE = 64 * 1024
+
+
+def dumps(data: Any) -> str:
+    """
+    Compact JSON, encoded the same way as DRF's JSONRenderer.
+    """
+    return json.dumps(
+        data,
+        cls=JSONEncoder,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    )
+
+
+def iter_buffered(parts: Iterable[str]) -> Iterator[bytes]:
+    buffer, size = [], 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= BUFFER_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+async def aiter_buffered(parts: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    buffer, size = [], 0
+    async for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= BUFFER_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def iter_ndjson(
+    rows: Iterable[Any], serialize: Callable[[Any], Any]
+) -> Iterator[bytes]:
+    """
+    One JSON document per line, serialized as rows are read.
+    """
+    return iter_buffered(f"{dumps(serialize(row))}\n" for row in rows)
+
+
+def iter_json_array(
+    rows: Iterable[Any], serialize: Callable[[Any], Any]
+) -> Iterator[bytes]:
+    """
+    A JSON array written element by element, so it is never held in memory.
+    """
+
+    def parts() -> Iterator[str]:
+        yield "["
+        separator = ""
+        for row in rows:
+            yield separator
+            yield dumps(serialize(row))
+            separator = ","
+        yield "]"
+
+    return iter_buffered(parts())
+
+
+def aiter_ndjson(
+    rows: AsyncIterable[Any], serialize: Callable[[Any], Any]
+) -> AsyncIterator[bytes]:
+    """
+    ``iter_ndjson`` over rows read with the async ORM.
+    """
+
+    async def parts() -> AsyncIterator[str]:
+        async for row in rows:
+            yield f"{dumps(serialize(row))}\n"
+
+    return aiter_buffered(parts())
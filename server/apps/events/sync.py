@@ -0,0 +1,35 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def encode_token(change_number: int, issued_at: datetime) -> str:
+    """
+    An opaque sync token remembering the user's change number the changes
+    were read up to and when.
+    """
+    raw = f"{change_number}:{issued_at.isoformat()}"
+    return urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+
+def decode_token(token: str) -> tuple[int, datetime]:
+    try:
+        raw = urlsafe_b64decode(token.encode("ascii")).decode("ascii")
+        change_number, _, issued_at = raw.partition(":")
+        change_number = int(change_number)
+        issued_at = datetime.fromisoformat(issued_at)
+    except (BinasciiError, UnicodeError, ValueError):
+        raise ValueError("Invalid sync token.")
+    if change_number < 0 or timezone.is_naive(issued_at):
+        raise ValueError("Invalid sync token.")
+    return change_number, issued_at
+
+
+def is_expired(issued_at: datetime) -> bool:
+    """
+    Whether tombstones a token relies on may already be pruned.
+    """
+    return issued_at < timezone.now() - settings.EVENTS["TOMBSTONE_RETENTION"]
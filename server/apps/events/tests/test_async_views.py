@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.auth.cache import user_cache
+from apps.events.cache import month_cache
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class AsyncEventViewTests(TestCase):
+    """
+    The async views answer what their sync counterparts do, the check
+    behind the numbers of ``scripts/benchmark_async_views.py``.
+    """
+
+    def setUp(self):
+        month_cache.cache.clear()
+        user_cache.cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        start = timezone.make_aware(datetime(2025, 3, 3, 9, 0))
+        for index, recurring_type in enumerate(["DAILY", "WEEKLY", "MONTHLY"]):
+            Event.objects.create_event(
+                user=self.user,
+                name=f"Event {index}",
+                description="Sync",
+                recurring_type=recurring_type,
+                start_datetime=start + timedelta(hours=index),
+                end_datetime=start + timedelta(hours=index, minutes=30),
+            )
+        self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+    async def assertSameAnswer(self, path: str):
+        sync_response = await self.async_client.get(path, headers=self.headers)
+        month_cache.cache.clear()
+        async_response = await self.async_client.get(
+            path.replace("/events/", "/events/async/", 1), headers=self.headers
+        )
+
+        self.assertEqual(sync_response.status_code, 200)
+        self.assertEqual(async_response.status_code, 200)
+        self.assertIn("ETag", async_response)
+        # page links point back at the view that answered
+        self.assertEqual(
+            sync_response.content,
+            async_response.content.replace(b"/events/async/", b"/events/"),
+        )
+
+    async def test_list_answers_like_the_sync_view(self):
+        await self.assertSameAnswer("/v1/events/")
+
+    async def test_paginated_list_answers_like_the_sync_view(self):
+        await self.assertSameAnswer("/v1/events/?page_size=2")
+
+    async def test_month_answers_like_the_sync_view(self):
+        await self.assertSameAnswer("/v1/events/2025/3/")
+
+    async def test_missing_token_is_unauthorized(self):
+        response = await self.async_client.get("/v1/events/async/")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_invalid_month_is_a_bad_request(self):
+        response = await self.async_client.get(
+            "/v1/events/async/2025/13/", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("month", response.json())
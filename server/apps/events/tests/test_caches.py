@@ -0,0 +1,59 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from django.test import SimpleTestCase
+
+from apps.events.autocomplete import AutocompleteIndex
+from apps.events.cache import MonthCache
+
+
+class MonthCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = MonthCache(maxsize=16)
+        self.user_id = uuid.uuid4()
+
+    def test_payload_of_an_older_version_is_not_served(self):
+        self.cache.set(self.user_id, 2025, 3, 1, ["stale"])
+
+        self.assertIsNone(self.cache.get(self.user_id, 2025, 3, 2))
+        self.assertEqual(self.cache.get(self.user_id, 2025, 3, 1), ["stale"])
+
+    def test_untouched_months_are_carried_over_to_the_new_version(self):
+        self.cache.set(self.user_id, 2025, 3, 1, ["march"])
+        self.cache.set(self.user_id, 2025, 6, 1, ["june"])
+        start = datetime(2025, 3, 10, 9, 0, tzinfo=UTC)
+
+        self.cache.invalidate_spans(
+            self.user_id, [(start, start + timedelta(hours=1), "YEARLY")], 2
+        )
+
+        self.assertIsNone(self.cache.get(self.user_id, 2025, 3, 2))
+        self.assertEqual(self.cache.get(self.user_id, 2025, 6, 2), ["june"])
+        self.assertIsNone(self.cache.get(self.user_id, 2025, 6, 1))
+
+    def test_months_missing_a_version_are_not_carried_over(self):
+        # version 2 was written by another process
+        self.cache.set(self.user_id, 2025, 6, 1, ["june"])
+
+        self.cache.invalidate_spans(self.user_id, [], 3)
+
+        self.assertIsNone(self.cache.get(self.user_id, 2025, 6, 3))
+
+
+class AutocompleteIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = AutocompleteIndex(maxsize=16)
+        self.user_id = uuid.uuid4()
+
+    def test_index_loaded_while_a_name_is_added_is_not_kept(self):
+        def load():
+            # the write commits after the names were read
+            self.index.update(self.user_id, added=["Standup"])
+            return ["Retro"]
+
+        self.index.suggest(self.user_id, "", 10, load=load)
+
+        suggestions = self.index.suggest(
+            self.user_id, "", 10, load=lambda: ["Retro", "Standup"]
+        )
+        self.assertEqual(suggestions, ["Retro", "Standup"])
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.cache import month_cache
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        # the serializer only accepts events starting in the future
+        year = timezone.localdate().year + 1
+        self.paths = ("/v1/events/", f"/v1/events/{year}/3/")
+        month_cache.cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(year, 3, 10, 9, 0))
+        self.event = Event.objects.create_event(
+            user=self.user,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="WEEKLY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+        )
+        self.detail = f"/v1/events/{self.event.id}/"
+        self.payload = {
+            "name": "Standup",
+            "description": "Daily sync",
+            "recurring_type": "WEEKLY",
+            "start_date": f"{year}-03-10",
+            "start_time": "10:00",
+            "end_date": f"{year}-03-10",
+            "end_time": "10:15",
+        }
+
+    def etags(self) -> dict[str, str]:
+        etags = {}
+        for path in self.paths:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            etags[path] = response["ETag"]
+        return etags
+
+    def assert_modified(self, etags: dict[str, str]) -> None:
+        for path, etag in etags.items():
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, path)
+            self.assertNotEqual(response["ETag"], etag, path)
+
+    def test_unchanged_calendar_answers_not_modified(self):
+        for path, etag in self.etags().items():
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304, path)
+
+    def test_put_changes_the_etag(self):
+        etags = self.etags()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(self.detail, self.payload, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assert_modified(etags)
+
+    def test_patch_changes_the_etag(self):
+        etags = self.etags()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.detail, {"name": "Retro"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.name, "Retro")
+        self.assert_modified(etags)
+
+    def test_delete_changes_the_etag(self):
+        etags = self.etags()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(self.detail)
+        self.assertEqual(response.status_code, 204)
+        self.assert_modified(etags)
+
+    def test_write_from_another_process_is_not_served_from_cache(self):
+        etags = self.etags()
+        # on commit callbacks are not run, as in a worker that did not write
+        start = self.event.start_datetime + timedelta(days=1)
+        Event.objects.create_event(
+            user=self.user,
+            name="Retro",
+            description="Sprint review",
+            recurring_type="WEEKLY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=30),
+        )
+
+        self.assert_modified(etags)
+        response = self.client.get(self.paths[1])
+        names = {item["name"] for item in response.json()}
+        self.assertEqual(names, {"Standup", "Retro"})
+
+    def test_profile_update_does_not_reset_the_events_version(self):
+        etags = self.etags()
+        version = User.objects.get_events_version(self.user.id)
+
+        response = self.client.patch(
+            f"/v1/users/{self.user.id}/", {"first_name": "Ada"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        User.objects.update_password(self.user.id, "y")
+        self.assertEqual(User.objects.get_events_version(self.user.id), version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.detail, {"name": "Retro"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assert_modified(etags)
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.managers import EventManager
+from apps.users.models import User
+
+
+class EventBulkCreateTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        year = timezone.localdate().year + 1
+        self.item = {
+            "name": "Standup",
+            "description": "Daily sync",
+            "recurring_type": "DAILY",
+            "start_date": f"{year}-03-10",
+            "start_time": "09:00",
+            "end_date": f"{year}-03-10",
+            "end_time": "09:15",
+        }
+
+    def test_name_taken_by_a_concurrent_request_answers_bad_request(self):
+        with mock.patch.object(
+            EventManager,
+            "bulk_create",
+            side_effect=IntegrityError("UNIQUE constraint failed"),
+        ):
+            response = self.client.post("/v1/events/bulk/", [self.item], format="json")
+
+        self.assertEqual(response.status_code, 400)
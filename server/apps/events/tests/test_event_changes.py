@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class EventChangesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(2025, 3, 10, 9, 0))
+        self.event = Event.objects.create_event(
+            user=self.user,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="WEEKLY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+        )
+
+    def changes(self, token: str | None = None) -> dict:
+        params = {"since": token} if token else {}
+        response = self.client.get("/v1/events/changes/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_api_delete_is_reported_as_deleted(self):
+        first = self.changes()
+        self.assertTrue(first["reset"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/v1/events/{self.event.id}/")
+        self.assertEqual(response.status_code, 204)
+
+        second = self.changes(first["token"])
+        self.assertFalse(second["reset"])
+        self.assertEqual(second["changed"], [])
+        self.assertEqual(second["deleted"], [str(self.event.id)])
+
+    def test_write_stamped_before_the_token_is_still_reported(self):
+        token = self.changes()["token"]
+
+        # a transaction that started before the token was issued and
+        # commits after it, its timestamps predate the token
+        earlier = timezone.now() - timedelta(minutes=5)
+        with mock.patch("apps.events.managers.timezone.now", return_value=earlier):
+            Event.objects.bulk_update_events(
+                self.user,
+                Event.objects.filter(id=self.event.id),
+                description="Moved",
+            )
+
+        changes = self.changes(token)
+        self.assertFalse(changes["reset"])
+        self.assertEqual(
+            [item["id"] for item in changes["changed"]], [str(self.event.id)]
+        )
+        self.assertEqual(self.changes(changes["token"])["changed"], [])
+
+    def test_invalid_token_is_rejected(self):
+        response = self.client.get("/v1/events/changes/", {"since": "bm9wZQ=="})
+        self.assertEqual(response.status_code, 400)
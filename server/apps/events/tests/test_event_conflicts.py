@@ -0,0 +1,94 @@
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import Event, EventOccurrence
+from apps.users.models import User
+
+
+class EventConflictCheckTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        # the first Monday of next March
+        self.monday = date(timezone.localdate().year + 1, 3, 1)
+        self.monday += timedelta(days=-self.monday.weekday() % 7)
+        start = timezone.make_aware(datetime.combine(self.monday, time(9)))
+        Event.objects.create_event(
+            user=self.user,
+            name="Planning",
+            description="Weekly planning",
+            recurring_type="WEEKLY",
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=1),
+        )
+
+    def payload(self, name: str, day: date, recurring_type: str) -> dict:
+        return {
+            "name": name,
+            "description": "Sync",
+            "recurring_type": recurring_type,
+            "start_date": day.isoformat(),
+            "start_time": "09:30",
+            "end_date": day.isoformat(),
+            "end_time": "09:45",
+            "check_conflicts": True,
+        }
+
+    def test_overlap_of_a_later_occurrence_is_a_conflict(self):
+        tuesday = self.monday + timedelta(days=1)
+        response = self.client.post(
+            "/v1/events/create/",
+            self.payload("Standup", tuesday, "DAILY"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Planning", str(response.json()))
+
+    def test_occurrences_apart_are_not_a_conflict(self):
+        tuesday = self.monday + timedelta(days=1)
+        response = self.client.post(
+            "/v1/events/create/",
+            self.payload("Retro", tuesday, "WEEKLY"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_conflicts_inside_the_horizon_are_read_from_occurrences(self):
+        EventOccurrence.objects.extend_horizon()
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        start = timezone.make_aware(datetime.combine(tomorrow, time(9)))
+        Event.objects.create_event(
+            user=self.user,
+            name="Review",
+            description="Daily review",
+            recurring_type="DAILY",
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=1),
+        )
+        start = timezone.make_aware(
+            datetime.combine(tomorrow + timedelta(days=2), time(9, 30))
+        )
+
+        with mock.patch(
+            "apps.events.managers.expand_events", side_effect=AssertionError
+        ):
+            conflicts = Event.objects.find_conflicts(
+                self.user, start, start + timedelta(minutes=15), "DAILY"
+            )
+
+        self.assertIn("Review", {occurrence.name for occurrence in conflicts})
+
+    def test_bulk_create_rejects_conflict_checks(self):
+        tuesday = self.monday + timedelta(days=1)
+        response = self.client.post(
+            "/v1/events/bulk/",
+            [self.payload("Retro", tuesday, "WEEKLY")],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("check_conflicts", response.json()["results"][0]["errors"])
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.cache import month_cache
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class EventDetailDeleteTests(TestCase):
+    def setUp(self):
+        month_cache.cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(2025, 3, 10, 9, 0))
+        self.event = Event.objects.create_event(
+            user=self.user,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="WEEKLY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+        )
+
+    def month_ids(self) -> set[str]:
+        response = self.client.get("/v1/events/2025/3/")
+        self.assertEqual(response.status_code, 200)
+        return {item["id"] for item in response.json()}
+
+    def test_delete_drops_the_event_from_the_cached_month(self):
+        self.assertIn(str(self.event.id), self.month_ids())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/v1/events/{self.event.id}/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Event.objects.filter(id=self.event.id).exists())
+        self.assertNotIn(str(self.event.id), self.month_ids())
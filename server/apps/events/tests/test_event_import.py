@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.events.models import Event
+from apps.users.models import User
+
+
+@override_settings(EVENTS={**settings.EVENTS, "CHUNK_SIZE": 2})
+class EventImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def upload(self, content: bytes):
+        return self.client.post(
+            "/v1/events/import/",
+            {"file": SimpleUploadedFile("events.csv", content)},
+            format="multipart",
+        )
+
+    def test_unreadable_file_reports_the_committed_batches(self):
+        rows = b"".join(
+            f"Event {index},Sync,DAILY,2025-03-1{index}T09:00,"
+            f"2025-03-1{index}T09:15\n".encode()
+            for index in range(3)
+        )
+        content = (
+            b"name,description,recurring_type,start_datetime,end_datetime\n"
+            + rows
+            + b"\xff\xfe,broken\n"
+        )
+
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, 400)
+        body = response.json()
+        self.assertEqual(body["errors"], ["The file is not UTF-8 encoded."])
+        self.assertEqual(body["created"], 2)
+        self.assertEqual([batch["batch"] for batch in body["batches"]], [1])
+        self.assertEqual(Event.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class EventListPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(2025, 3, 10, 9, 0))
+        self.ids = [
+            str(
+                Event.objects.create_event(
+                    user=self.user,
+                    name=f"Event {index}",
+                    description="Sync",
+                    recurring_type="DAILY",
+                    start_datetime=start + timedelta(hours=index),
+                    end_datetime=start + timedelta(hours=index, minutes=15),
+                ).id
+            )
+            for index in range(5)
+        ]
+
+    def test_plain_list_answers_every_event_as_an_array(self):
+        response = self.client.get("/v1/events/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.json()], self.ids)
+
+    def test_page_size_pages_through_next_links(self):
+        response = self.client.get("/v1/events/", {"page_size": 2})
+        ids = []
+        while True:
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            ids.extend(item["id"] for item in page["results"])
+            if page["next"] is None:
+                break
+            response = self.client.get(page["next"])
+
+        self.assertEqual(ids, self.ids)
@@ -0,0 +1,30 @@
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.events.pubsub import broker
+from apps.events.views import EventStreamView
+from apps.users.models import User
+
+
+class EventStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+    async def test_unread_response_subscribes_to_nothing(self):
+        subscribers = broker.subscribers()
+        response = await self.async_client.get(
+            "/v1/events/stream/", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(broker.subscribers(), subscribers)
+
+    async def test_subscription_lives_while_the_stream_is_read(self):
+        subscribers = broker.subscribers()
+        stream = EventStreamView().stream(self.user.id)
+
+        self.assertEqual(await anext(stream), "retry: 5000\n\n")
+        self.assertEqual(broker.subscribers(), subscribers + 1)
+
+        await stream.aclose()
+        self.assertEqual(broker.subscribers(), subscribers)
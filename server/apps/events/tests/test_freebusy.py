@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class FreeBusyTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.other = User.objects.create_user(email="other@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        start = timezone.make_aware(datetime(2025, 3, 10, 9, 0))
+        Event.objects.create_event(
+            user=self.other,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="DAILY",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+        )
+        self.window = {"start": "2025-03-10T00:00:00", "end": "2025-03-11T00:00:00"}
+
+    def freebusy(self, users: list[User]):
+        return self.client.get(
+            "/v1/events/freebusy/",
+            {**self.window, "users": ",".join(str(user.id) for user in users)},
+        )
+
+    def test_own_busy_time_is_readable(self):
+        response = self.freebusy([self.user])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["busy"], {str(self.user.id): []})
+
+    def test_other_users_busy_time_is_forbidden(self):
+        response = self.freebusy([self.user, self.other])
+        self.assertEqual(response.status_code, 403)
+
+    def test_staff_reads_other_users_busy_time(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.freebusy([self.other])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["busy"][str(self.other.id)]), 1)
+
+    def test_slots_of_other_users_are_forbidden(self):
+        response = self.client.get(
+            "/v1/events/slots/",
+            {**self.window, "duration": 30, "users": str(self.other.id)},
+        )
+        self.assertEqual(response.status_code, 403)
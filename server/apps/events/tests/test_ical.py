@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from apps.events.ical import iter_calendar
+
+WARSAW = ZoneInfo("Europe/Warsaw")
+
+
+def make_row(start: datetime, end: datetime, recurring_type: str):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name="Standup",
+        description="Daily sync",
+        start_datetime=start.astimezone(ZoneInfo("UTC")),
+        end_datetime=end.astimezone(ZoneInfo("UTC")),
+        recurring_type=recurring_type,
+    )
+
+
+class CalendarExportTests(SimpleTestCase):
+    def export(self, *rows) -> list[str]:
+        with timezone.override(WARSAW):
+            return "".join(iter_calendar(rows)).split("\r\n")
+
+    def test_times_are_local_to_a_described_timezone(self):
+        lines = self.export(
+            make_row(
+                datetime(2025, 3, 10, 9, 0, tzinfo=WARSAW),
+                datetime(2025, 3, 10, 9, 15, tzinfo=WARSAW),
+                "WEEKLY",
+            )
+        )
+
+        self.assertIn("BEGIN:VTIMEZONE", lines)
+        self.assertIn("TZID:Europe/Warsaw", lines)
+        self.assertIn("RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU", lines)
+        self.assertIn("DTSTART;TZID=Europe/Warsaw:20250310T090000", lines)
+        self.assertIn("DTEND;TZID=Europe/Warsaw:20250310T091500", lines)
+        self.assertIn("RRULE:FREQ=WEEKLY", lines)
+        self.assertLess(lines.index("END:VTIMEZONE"), lines.index("BEGIN:VEVENT"))
+
+    def test_monthly_on_the_31st_falls_on_the_last_day_of_shorter_months(self):
+        lines = self.export(
+            make_row(
+                datetime(2025, 1, 31, 9, 0, tzinfo=WARSAW),
+                datetime(2025, 1, 31, 10, 0, tzinfo=WARSAW),
+                "MONTHLY",
+            )
+        )
+
+        self.assertIn("RRULE:FREQ=MONTHLY;BYMONTHDAY=28,29,30,31;BYSETPOS=-1", lines)
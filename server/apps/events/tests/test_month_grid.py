@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.cache import month_cache
+from apps.events.models import Event
+from apps.users.models import User
+
+
+class EventMonthGridTests(TestCase):
+    def setUp(self):
+        month_cache.cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_event(self, name: str, recurring_type: str, hours: int) -> Event:
+        start = timezone.make_aware(datetime(2025, 1, 6, 9, 0))
+        return Event.objects.create_event(
+            user=self.user,
+            name=name,
+            description="Sync",
+            recurring_type=recurring_type,
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=hours),
+        )
+
+    def grid(self) -> dict:
+        response = self.client.get("/v1/events/2025/3/grid/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_side_table_carries_the_occurrence_dates(self):
+        event = self.create_event("Planning", "WEEKLY", 1)
+
+        grid = self.grid()
+
+        tile = next(tile for tile in grid["tiles"] if tile["date"] == "2025-03-10")
+        self.assertEqual(tile["events"], [f"{event.id}@2025-03-10T08:00:00"])
+        body = grid["events"][tile["events"][0]]
+        self.assertEqual(body["id"], str(event.id))
+        self.assertEqual(body["start_date"], "2025-03-10")
+
+    def test_overlapping_occurrences_are_listed_once_per_tile(self):
+        self.create_event("Shift", "DAILY", 30)
+
+        grid = self.grid()
+
+        for tile in grid["tiles"]:
+            self.assertEqual(len(tile["events"]), len(set(tile["events"])))
+            for key in tile["events"]:
+                self.assertIn(key, grid["events"])
+        tile = next(tile for tile in grid["tiles"] if tile["date"] == "2025-03-10")
+        # the occurrence started the day before runs into this one
+        self.assertEqual(len(tile["events"]), 2)
+
+    def test_invalid_month_is_a_bad_request(self):
+        for path in (
+            "/v1/events/2025/13/grid/",
+            "/v1/events/2025/0/",
+            "/v1/events/0000/1/",
+        ):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 400, path)
+            self.assertIn("month", response.json())
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.db.models import Max, Min
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.events.models import Event, EventOccurrence
+from apps.users.models import User
+
+
+class OccurrenceRefreshTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        self.horizon = EventOccurrence.objects.extend_horizon()
+        self.start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+
+    def assertMaterializedUpToHorizon(self, event: Event, period: timedelta):
+        span = EventOccurrence.objects.filter(event=event).aggregate(
+            first=Min("start_datetime"), last=Max("start_datetime")
+        )
+        self.assertEqual(span["first"], self.start)
+        # one period more would pass the horizon, an hour of slack for DST
+        self.assertLess(span["last"], self.horizon.materialized_until)
+        self.assertGreaterEqual(
+            span["last"] + period + timedelta(hours=1),
+            self.horizon.materialized_until,
+        )
+
+    def test_written_events_are_materialized_up_to_the_horizon(self):
+        event = Event.objects.create_event(
+            user=self.user,
+            name="Standup",
+            description="Daily sync",
+            recurring_type="WEEKLY",
+            start_datetime=self.start,
+            end_datetime=self.start + timedelta(minutes=15),
+        )
+        self.assertMaterializedUpToHorizon(event, timedelta(weeks=1))
+
+        Event.objects.update_event(event.id, self.user, recurring_type="DAILY")
+        self.assertMaterializedUpToHorizon(event, timedelta(days=1))
@@ -0,0 +1,45 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.events.models import EVENT_TIME_INDEXES, Event
+from apps.events.utils import grid_range_for_month
+from apps.users.models import User
+
+
+class EventQueryPlanTests(TestCase):
+    """
+    The calendar lookups seek on a per-user time index instead of
+    scanning the events table (SQLite's EXPLAIN QUERY PLAN).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        today = timezone.localdate()
+        self.window_start, self.window_end = grid_range_for_month(
+            today.year, today.month
+        )
+
+    def assertSeeksOnIndex(self, queryset):
+        plan = queryset.explain()
+        self.assertTrue(
+            any(
+                f"SEARCH events USING INDEX {name} " in plan
+                for name in EVENT_TIME_INDEXES
+            ),
+            plan,
+        )
+        self.assertIn("(user_id=? AND start_datetime", plan)
+
+    def test_overlap_query_seeks_on_the_user_time_index(self):
+        self.assertSeeksOnIndex(
+            Event.objects.filter_overlapping(
+                user=self.user,
+                window_start=self.window_start,
+                window_end=self.window_end,
+            )
+        )
+
+    def test_month_query_seeks_on_the_user_time_index(self):
+        self.assertSeeksOnIndex(
+            Event.objects.filter(user=self.user, start_datetime__lt=self.window_end)
+        )
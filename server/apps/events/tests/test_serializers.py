@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.events.enums import RecurringType
+from apps.events.models import Event
+from apps.events.recurrence import expand_events
+from apps.events.serializers import EventReadSerializer, EventSerializer
+from apps.users.models import User
+
+
+class EventReadSerializerTests(TestCase):
+    """
+    The fast path renders byte for byte what ``EventSerializer`` does,
+    the check ``scripts/benchmark_event_serializers.py`` makes on large
+    tables.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="x")
+        start = timezone.make_aware(datetime(2025, 3, 30, 1, 59, 7))
+        types = RecurringType.values()
+        Event.objects.bulk_create(
+            [
+                Event(
+                    user=self.user,
+                    name=f'Event {index}, "quoted" é',
+                    description=f"Description {index}\nsecond line",
+                    recurring_type=types[index % len(types)],
+                    start_datetime=start + timedelta(hours=5 * index),
+                    end_datetime=start + timedelta(hours=5 * index, minutes=30),
+                )
+                for index in range(12)
+            ]
+        )
+        self.queryset = Event.objects.filter(user=self.user).order_by("start_datetime")
+        self.renderer = JSONRenderer()
+
+    def assertSameOutput(self, expected, actual):
+        self.assertEqual(self.renderer.render(expected), self.renderer.render(actual))
+
+    def test_rows_render_like_the_model_serializer(self):
+        self.assertSameOutput(
+            EventSerializer(self.queryset, many=True).data,
+            EventReadSerializer.many(EventReadSerializer.rows(self.queryset)),
+        )
+
+    def test_occurrences_render_like_the_model_serializer(self):
+        occurrences = expand_events(
+            self.queryset,
+            timezone.make_aware(datetime(2025, 3, 1)),
+            timezone.make_aware(datetime(2025, 5, 1)),
+        )
+        self.assertSameOutput(
+            EventSerializer(occurrences, many=True).data,
+            EventReadSerializer.many(occurrences),
+        )
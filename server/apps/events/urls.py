@@ -1,10 +1,27 @@
 from django.urls import path, re_path
 
 from apps.events.views import (
+    AsyncEventListView,
+    AsyncEventMonthFilterListView,
+    EventAutocompleteView,
+    EventBulkView,
+    EventChangesView,
+    EventConflictView,
     EventCreateView,
+    EventDayView,
     EventDetailView,
+    EventExportView,
+    EventICalExportView,
+    EventImportView,
     EventListView,
     EventMonthFilterListView,
+    EventMonthGridView,
+    EventRangeView,
+    EventSearchView,
+    EventStreamView,
+    EventWeekView,
+    FreeBusyView,
+    SlotFinderView,
 )
 
 urlpatterns = [
@@ -18,6 +35,71 @@ urlpatterns = [
         EventCreateView.as_view(),
         name="event-create",
     ),
+    path(
+        "bulk/",
+        EventBulkView.as_view(),
+        name="events-bulk",
+    ),
+    path(
+        "import/",
+        EventImportView.as_view(),
+        name="events-import",
+    ),
+    path(
+        "freebusy/",
+        FreeBusyView.as_view(),
+        name="events-freebusy",
+    ),
+    path(
+        "slots/",
+        SlotFinderView.as_view(),
+        name="events-slots",
+    ),
+    path(
+        "conflicts/",
+        EventConflictView.as_view(),
+        name="events-conflicts",
+    ),
+    path(
+        "range/",
+        EventRangeView.as_view(),
+        name="events-range",
+    ),
+    path(
+        "search/",
+        EventSearchView.as_view(),
+        name="events-search",
+    ),
+    path(
+        "autocomplete/",
+        EventAutocompleteView.as_view(),
+        name="events-autocomplete",
+    ),
+    path(
+        "changes/",
+        EventChangesView.as_view(),
+        name="events-changes",
+    ),
+    path(
+        "stream/",
+        EventStreamView.as_view(),
+        name="events-stream",
+    ),
+    path(
+        "async/",
+        AsyncEventListView.as_view(),
+        name="events-list-async",
+    ),
+    path(
+        "export/",
+        EventExportView.as_view(),
+        name="events-export",
+    ),
+    path(
+        "export/ics/",
+        EventICalExportView.as_view(),
+        name="events-export-ics",
+    ),
     path(
         "<str:event_id>/",
         EventDetailView.as_view(),
@@ -33,6 +115,26 @@ urlpatterns = [
         EventMonthFilterListView.as_view(),
         name="event-month-filter",
     ),
+    re_path(
+        r"^async/(?P<year>\d{4})/(?P<month>\d{1,2})/$",
+        AsyncEventMonthFilterListView.as_view(),
+        name="event-month-filter-async",
+    ),
+    re_path(
+        r"^(?P<year>\d{4})/(?P<month>\d{1,2})/grid/$",
+        EventMonthGridView.as_view(),
+        name="event-month-grid",
+    ),
+    re_path(
+        r"^(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})/$",
+        EventDayView.as_view(),
+        name="event-day",
+    ),
+    re_path(
+        r"^(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})/week/$",
+        EventWeekView.as_view(),
+        name="event-week",
+    ),
     path(
         "<str:event_id>/",
         EventDetailView.as_view(),
@@ -1,7 +1,13 @@
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable
 
 from django.utils import timezone
 
+if TYPE_CHECKING:
+    from apps.events.recurrence import Occurrence
+
+GRID_TILES = 42
+
 
 def grid_range_for_month(year: int, month: int) -> tuple:
     """
@@ -42,3 +48,120 @@ def get_next_month(year: int, month: int):
     if month == 12:
         return year + 1, 1
     return year, month + 1
+
+
+def calendar_window_for_month(year: int, month: int) -> tuple:
+    """
+    Calculate the window covered by the calendar of a month.
+
+    The calendar shows the grids of the previous, current and next month,
+    so the window starts at the first tile of the earliest grid and ends
+    (exclusive) after the last tile of the latest grid.
+
+    Args:
+        year (int): The year of the month.
+        month (int): The month (1-12).
+
+    Returns:
+        tuple: A tuple containing the start and the exclusive end of the window.
+    """
+    # current date
+    current_start, current_end = grid_range_for_month(year, month)
+
+    # previous date
+    prev_year, prev_month = get_prev_month(year, month)
+    prev_start, prev_end = grid_range_for_month(prev_year, prev_month)
+
+    # next date
+    next_year, next_month = get_next_month(year, month)
+    next_start, next_end = grid_range_for_month(next_year, next_month)
+
+    # calculate overall start and end dates, the end is exclusive
+    # so the whole last tile of the grid is included
+    overall_start = min(prev_start, current_start, next_start)
+    overall_end = max(prev_end, current_end, next_end) + timedelta(days=1)
+
+    return overall_start, overall_end
+
+
+def day_window(year: int, month: int, day: int) -> tuple:
+    """
+    Calculate the window of a single calendar day.
+
+    Args:
+        year (int): The year of the day.
+        month (int): The month (1-12).
+        day (int): The day of the month.
+
+    Returns:
+        tuple: A tuple containing the start and the exclusive end of the day.
+    """
+    start = timezone.make_aware(datetime(year, month, day))
+    return start, start + timedelta(days=1)
+
+
+def week_window(year: int, month: int, day: int) -> tuple:
+    """
+    Calculate the window of the week containing a day.
+
+    Weeks start on Monday, the same as the rows of a month grid.
+
+    Args:
+        year (int): The year of the day.
+        month (int): The month (1-12).
+        day (int): The day of the month.
+
+    Returns:
+        tuple: A tuple containing the start and the exclusive end of the week.
+    """
+    first_day = datetime(year, month, day) - timedelta(
+        days=datetime(year, month, day).weekday()
+    )
+    start = timezone.make_aware(first_day)
+    return start, start + timedelta(days=7)
+
+
+def bucket_occurrences(
+    occurrences: Iterable["Occurrence"],
+    grid_start: datetime,
+    key: Callable[["Occurrence"], Hashable] = lambda occurrence: occurrence.id,
+) -> list[list]:
+    """
+    Assign occurrences to the 42 tiles of a month grid.
+
+    Every occurrence is added to each tile (day) it spans, so multi-day
+    events appear in all their days. Occurrences are expected sorted by
+    start, which keeps every tile sorted too; the whole grid is built
+    in a single pass. A key is listed once per tile even when several
+    occurrences map to it.
+
+    Args:
+        occurrences (Iterable[Occurrence]): Occurrences sorted by start.
+        grid_start (datetime): The start of the first tile.
+        key (Callable): What a tile lists for an occurrence, its event id
+            by default.
+
+    Returns:
+        list: 42 lists of keys, one per tile.
+    """
+    tiles = [{} for _ in range(GRID_TILES)]
+    first_day = timezone.localtime(grid_start).date()
+
+    for occurrence in occurrences:
+        start_day = timezone.localtime(occurrence.start_datetime).date()
+        # an event ending at midnight does not take the next day
+        end_day = timezone.localtime(
+            max(
+                occurrence.start_datetime,
+                occurrence.end_datetime - timedelta.resolution,
+            )
+        ).date()
+
+        first = max(0, (start_day - first_day).days)
+        last = min(GRID_TILES - 1, (end_day - first_day).days)
+        value = key(occurrence)
+        for index in range(first, last + 1):
+            # dicts keep the first position of a key, in start order
+            tiles[index].setdefault(value)
+
+    return [list(tile) for tile in tiles]
@@ -1,25 +1,83 @@
+import asyncio
+import codecs
 import uuid
-from datetime import datetime
-from tkinter.scrolledtext import example
+from datetime import UTC, datetime, timedelta
 
-from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views import View
+from drf_spectacular.utils import extend_schema
 from rest_framework import generics, mixins, status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import (
+    APIException,
+    NotAuthenticated,
+    NotFound,
+    ValidationError,
+)
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 
+from apps.auth.authentication import AsyncJWTAuthentication
+from apps.events.cache import month_cache
+from apps.events.ical import ICalendarRenderer, iter_calendar
+from apps.events.importers import csv_records, ics_records, import_events
+from apps.events.mixins import (
+    AsyncConditionalGetMixin,
+    ConditionalGetMixin,
+    UserGroupMixin,
+)
 from apps.events.models import Event
+from apps.events.pagination import EventCursorPagination
+from apps.events.pubsub import broker
+from apps.events.recurrence import iter_occurrence_spans
+from apps.events.search import highlight
 from apps.events.serializers import (
+    EventAutocompleteSerializer,
+    EventBulkItemSerializer,
+    EventBulkSelectionSerializer,
+    EventBulkUpdateSerializer,
+    EventImportSerializer,
+    EventReadSerializer,
+    EventSearchSerializer,
     EventSerializer,
+    EventWindowSerializer,
+    FreeBusySerializer,
+    IntervalSerializer,
+    SlotFinderSerializer,
+)
+from apps.events.streaming import (
+    aiter_ndjson,
+    dumps,
+    iter_buffered,
+    iter_json_array,
+    iter_ndjson,
+)
+from apps.events.sync import decode_token, encode_token, is_expired
+from apps.events.utils import (
+    bucket_occurrences,
+    calendar_window_for_month,
+    day_window,
+    grid_range_for_month,
+    week_window,
 )
+from apps.users.models import User
 
 
 class EventListView(
+    ConditionalGetMixin,
     generics.GenericAPIView,
     mixins.ListModelMixin,
 ):
     permission_classes = [IsAuthenticated]
     serializer_class = EventSerializer
+    pagination_class = EventCursorPagination
     queryset = Event.objects.all()
 
     def get_queryset(self):
@@ -28,12 +86,113 @@ class EventListView(
             return Event.objects.filter(user=self.request.user)
         return Event.objects.none()
 
+    def iter_rows(self):
+        """
+        Every event of the user in (start_datetime, id) order,
+        read from the database in chunks.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            "start_datetime", "id"
+        )
+        return EventReadSerializer.rows(queryset).iterator(
+            chunk_size=settings.EVENTS["CHUNK_SIZE"]
+        )
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("stream") == "ndjson":
+            return StreamingHttpResponse(
+                iter_ndjson(self.iter_rows(), EventReadSerializer.to_representation),
+                content_type="application/x-ndjson",
+            )
+
+        queryset = EventReadSerializer.rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(EventReadSerializer.many(page))
+        return Response(EventReadSerializer.many(queryset))
+
     @extend_schema(
         tags=["events"],
         request=EventSerializer,
     )
     def get(self, request, *args, **kwargs):
-        return self.list(request, *args, **kwargs)
+        return self.conditional_get(self.list, request, *args, **kwargs)
+
+
+class EventExportView(EventListView):
+    """
+    All events of the user as one JSON array, streamed row by row.
+    """
+
+    pagination_class = None
+
+    def list(self, request, *args, **kwargs):
+        response = StreamingHttpResponse(
+            iter_json_array(self.iter_rows(), EventReadSerializer.to_representation),
+            content_type="application/json",
+        )
+        response["Content-Disposition"] = 'attachment; filename="events.json"'
+        return response
+
+
+class EventICalExportView(EventListView):
+    """
+    All events of the user as an iCalendar file streamed VEVENT by VEVENT,
+    recurring types are mapped to RRULEs. Optional ``?start=&end=``
+    keep only series with an occurrence in that range.
+    """
+
+    pagination_class = None
+    renderer_classes = [JSONRenderer, ICalendarRenderer]
+
+    def get_range(self) -> tuple[datetime | None, datetime | None]:
+        bounds = []
+        for param in ("start", "end"):
+            value = self.request.query_params.get(param)
+            parsed = parse_datetime(value) if value else None
+            if value and parsed is None:
+                raise ValidationError({param: ["Invalid datetime."]})
+            if parsed is not None and timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            bounds.append(parsed)
+        return bounds[0], bounds[1]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        _start, end = self.get_range()
+        if end is not None:
+            # a series can only occur in the range if it started before its end
+            queryset = queryset.filter(start_datetime__lt=end)
+        return queryset
+
+    def iter_rows(self):
+        rows = super().iter_rows()
+        start, end = self.get_range()
+        if start is None:
+            return rows
+
+        return (
+            row
+            for row in rows
+            if next(
+                iter_occurrence_spans(
+                    start=row.start_datetime,
+                    end=row.end_datetime,
+                    recurring_type=row.recurring_type,
+                    window_start=start,
+                    window_end=end or datetime.max.replace(tzinfo=UTC),
+                ),
+                None,
+            )
+        )
+
+    def list(self, request, *args, **kwargs):
+        response = StreamingHttpResponse(
+            iter_buffered(iter_calendar(self.iter_rows())),
+            content_type="text/calendar; charset=utf-8",
+        )
+        response["Content-Disposition"] = 'attachment; filename="events.ics"'
+        return response
 
 
 class EventCreateView(
@@ -54,6 +213,402 @@ class EventCreateView(
         serializer.save(user=self.request.user)
 
 
+class EventBulkView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventBulkItemSerializer
+
+    def get_items(self, request) -> list:
+        items = request.data
+        if isinstance(items, dict):
+            items = items.get("events")
+        if not isinstance(items, list) or not items:
+            raise ValidationError("Expected a non-empty list of events.")
+        if len(items) > settings.EVENTS["MAX_BULK_SIZE"]:
+            raise ValidationError(
+                f"At most {settings.EVENTS['MAX_BULK_SIZE']} events per request."
+            )
+        return items
+
+    @extend_schema(
+        tags=["events"],
+        request=EventBulkItemSerializer(many=True),
+    )
+    def post(self, request, *args, **kwargs):
+        items = self.get_items(request)
+
+        results = [None] * len(items)
+        valid = {}
+        for index, item in enumerate(items):
+            serializer = self.get_serializer(data=item)
+            if serializer.is_valid():
+                valid[index] = serializer.validated_data
+            else:
+                results[index] = {"status": "error", "errors": serializer.errors}
+
+        positions = list(valid)
+        try:
+            created, errors = Event.objects.bulk_create_events(
+                user=request.user,
+                items=list(valid.values()),
+            )
+        except DjangoValidationError as error:
+            # e.g. a name taken by a concurrent request after the check
+            raise ValidationError(error.messages)
+        for position, event in created.items():
+            results[positions[position]] = {
+                "status": "created",
+                "event": EventReadSerializer.to_representation(event),
+            }
+        for position, message in errors.items():
+            results[positions[position]] = {
+                "status": "error",
+                "errors": {"errors": [message]},
+            }
+
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(created) < len(items):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {
+                "created": len(created),
+                "failed": len(items) - len(created),
+                "results": [
+                    {"index": index, **result} for index, result in enumerate(results)
+                ],
+            },
+            status=response_status,
+        )
+
+    @extend_schema(
+        tags=["events"],
+        request=EventBulkUpdateSerializer,
+    )
+    def patch(self, request, *args, **kwargs):
+        serializer = EventBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        changes = serializer.validated_data["changes"]
+
+        shift_minutes = changes.get("shift_minutes")
+        updated = Event.objects.bulk_update_events(
+            user=request.user,
+            queryset=Event.objects.filter_selection(
+                user=request.user, **serializer.get_selection()
+            ),
+            description=changes.get("description"),
+            recurring_type=changes.get("recurring_type"),
+            shift=timedelta(minutes=shift_minutes) if shift_minutes else None,
+        )
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["events"],
+        request=EventBulkSelectionSerializer,
+    )
+    def delete(self, request, *args, **kwargs):
+        serializer = EventBulkSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        deleted = Event.objects.bulk_delete_events(
+            user=request.user,
+            queryset=Event.objects.filter_selection(
+                user=request.user, **serializer.get_selection()
+            ),
+        )
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+
+class EventImportView(generics.GenericAPIView):
+    """
+    Import an uploaded ``.ics`` or CSV file. The file is parsed as a
+    stream and written in batches, the response reports every batch.
+
+    Batches commit as they go. When the file turns out unreadable
+    half-way, the error is answered together with the batches already
+    committed, so the client knows what was imported.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventImportSerializer
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(
+        tags=["events"],
+        request=EventImportSerializer,
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        parse = (
+            ics_records if serializer.validated_data["type"] == "ics" else csv_records
+        )
+        lines = codecs.iterdecode(serializer.validated_data["file"], "utf-8-sig")
+        batches = []
+        try:
+            for batch in import_events(request.user, parse(lines)):
+                batches.append(batch)
+        except DjangoValidationError as error:
+            return self.aborted(batches, error.messages)
+        except UnicodeDecodeError:
+            return self.aborted(batches, ["The file is not UTF-8 encoded."])
+
+        report = self.report(batches)
+        return Response(
+            report,
+            status=(
+                status.HTTP_201_CREATED
+                if report["created"]
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+    @staticmethod
+    def report(batches: list) -> dict:
+        created = sum(batch.created for batch in batches)
+        seconds = sum(batch.seconds for batch in batches)
+        return {
+            "created": created,
+            "failed": sum(len(batch.errors) for batch in batches),
+            "seconds": round(seconds, 3),
+            "events_per_second": round(created / seconds) if seconds else 0,
+            "batches": [
+                {
+                    "batch": batch.number,
+                    "created": batch.created,
+                    "errors": batch.errors,
+                }
+                for batch in batches
+            ],
+        }
+
+    def aborted(self, batches: list, errors: list[str]) -> Response:
+        """
+        The import stopped on an unreadable file. The batches before it
+        stay committed and are reported next to the errors.
+        """
+        return Response(
+            {"errors": errors, **self.report(batches)},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class FreeBusyView(UserGroupMixin, generics.GenericAPIView):
+    """
+    Busy blocks of a group of users between ``start`` and ``end``,
+    without any event details.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = FreeBusySerializer
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[FreeBusySerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        window_start = serializer.validated_data["start"]
+        window_end = serializer.validated_data["end"]
+        user_ids = self.get_user_ids(serializer.validated_data)
+
+        busy = Event.objects.busy_intervals(user_ids, window_start, window_end)
+        return Response(
+            {
+                **IntervalSerializer((window_start, window_end)).data,
+                "busy": {
+                    str(user_id): IntervalSerializer(intervals, many=True).data
+                    for user_id, intervals in busy.items()
+                },
+            }
+        )
+
+
+class EventConflictView(generics.GenericAPIView):
+    """
+    Every pair of the user's overlapping events between ``start`` and
+    ``end``, recurrences included, with the time they overlap.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventWindowSerializer
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[EventWindowSerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        pairs = Event.objects.find_overlapping_pairs(
+            user=request.user,
+            window_start=serializer.validated_data["start"],
+            window_end=serializer.validated_data["end"],
+        )
+        return Response(
+            {
+                "conflicts": [
+                    {
+                        **IntervalSerializer(
+                            (
+                                max(first.start_datetime, second.start_datetime),
+                                min(first.end_datetime, second.end_datetime),
+                            )
+                        ).data,
+                        "events": EventReadSerializer.many([first, second]),
+                    }
+                    for first, second in pairs
+                ]
+            }
+        )
+
+
+class EventSearchView(generics.GenericAPIView):
+    """
+    Full-text search over the names and descriptions of the user's events,
+    best matches first. Snippets are HTML-escaped with the matching words
+    wrapped in ``<mark>``.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventSearchSerializer
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[EventSearchSerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        events = Event.objects.search(
+            user=request.user,
+            query=serializer.validated_data["q"],
+            limit=serializer.validated_data["limit"],
+        )
+        return Response(
+            [
+                {
+                    **EventReadSerializer.to_representation(event),
+                    "snippets": {
+                        "name": highlight(getattr(event, "name_snippet", None)),
+                        "description": highlight(
+                            getattr(event, "description_snippet", None)
+                        ),
+                    },
+                }
+                for event in events
+            ]
+        )
+
+
+class EventAutocompleteView(generics.GenericAPIView):
+    """
+    Names of the user's events starting with ``q``, for suggestions
+    while typing. Served from memory, not from the database.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventAutocompleteSerializer
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[EventAutocompleteSerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            Event.objects.suggest_names(
+                user=request.user,
+                prefix=serializer.validated_data["q"],
+                limit=serializer.validated_data["limit"],
+            )
+        )
+
+
+class EventChangesView(generics.GenericAPIView):
+    """
+    Delta sync: the events written and the ids of events deleted since
+    ``?since=<token>``, with the token to send next time. Without a token,
+    or with one older than the tombstone retention, every event is sent
+    with ``reset`` set so the client replaces its copy.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventSerializer
+
+    @extend_schema(
+        tags=["events"],
+    )
+    def get(self, request, *args, **kwargs):
+        # read before the changes: versions are handed out under the user
+        # row lock, so every write stamped up to it has committed. Writes
+        # committing meanwhile may be sent again with the next token.
+        change_number = User.objects.get_events_version(request.user.id)
+        issued_at = timezone.now()
+
+        token = request.query_params.get("since")
+        since = None
+        if token:
+            try:
+                since, since_issued_at = decode_token(token)
+            except ValueError as error:
+                raise ValidationError({"since": [str(error)]})
+            if is_expired(since_issued_at) or since > change_number:
+                since = None
+
+        if since is None:
+            changed = Event.objects.filter(user=request.user)
+            deleted = []
+        else:
+            changed, deleted = Event.objects.changes_since(request.user, since)
+
+        return Response(
+            {
+                "token": encode_token(change_number, issued_at),
+                "reset": since is None,
+                "changed": EventReadSerializer.many(EventReadSerializer.rows(changed)),
+                "deleted": deleted,
+            }
+        )
+
+
+class SlotFinderView(UserGroupMixin, generics.GenericAPIView):
+    """
+    The earliest free slots shared by a group of users.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = SlotFinderSerializer
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[SlotFinderSerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        slots = Event.objects.find_free_slots(
+            user_ids=self.get_user_ids(data),
+            window_start=data["start"],
+            window_end=data["end"],
+            duration=data["duration"],
+            limit=data["limit"],
+            work_start=data.get("work_start"),
+            work_end=data.get("work_end"),
+        )
+        return Response({"slots": IntervalSerializer(slots, many=True).data})
+
+
 class EventDetailView(
     generics.GenericAPIView,
     mixins.RetrieveModelMixin,
@@ -100,23 +655,354 @@ class EventDetailView(
     def delete(self, request, *args, **kwargs):
         return self.destroy(request, *args, **kwargs)
 
+    def perform_destroy(self, instance):
+        # the manager records the tombstone, bumps the events version
+        # and drops the cached months of the deleted event
+        Event.objects.delete_event(instance.id)
 
-class EventMonthFilterListView(generics.GenericAPIView, mixins.ListModelMixin):
+
+class EventMonthFilterListView(
+    ConditionalGetMixin,
+    generics.GenericAPIView,
+    mixins.ListModelMixin,
+):
     permission_classes = [IsAuthenticated]
     serializer_class = EventSerializer
 
-    def get_queryset(self):
+    def get_year_month(self) -> tuple[int, int]:
         today = datetime.now()
+        year = int(self.kwargs.get("year", today.year))
+        month = int(self.kwargs.get("month", today.month))
+        try:
+            # spans the neighbouring months, which must be valid dates too
+            calendar_window_for_month(year, month)
+        except (ValueError, OverflowError):
+            raise ValidationError({"month": "Invalid year or month."})
+        return year, month
+
+    def get_queryset(self):
+        year, month = self.get_year_month()
 
         return Event.objects.filter_calendar_month_events(
             user=self.request.user,
-            month=int(self.kwargs.get("month", today.month)),
-            year=int(self.kwargs.get("year", today.year)),
+            month=month,
+            year=year,
         )
 
+    def list(self, request, *args, **kwargs):
+        year, month = self.get_year_month()
+        version = self.events_version
+        payload = month_cache.get(request.user.id, year, month, version)
+        if payload is None:
+            payload = EventReadSerializer.many(self.get_queryset())
+            month_cache.set(request.user.id, year, month, version, payload)
+        return Response(payload)
+
     @extend_schema(
         tags=["events"],
         request=EventSerializer,
     )
     def get(self, request, *args, **kwargs):
-        return self.list(request, *args, **kwargs)
+        return self.conditional_get(self.list, request, *args, **kwargs)
+
+
+class EventMonthGridView(EventMonthFilterListView):
+    """
+    The 42 tiles of a month grid with occurrences assigned per day.
+    Occurrence bodies, with the dates of that occurrence, are listed
+    once in a side table keyed by ``<event id>@<start date>T<start time>``.
+    """
+
+    def get_queryset(self):
+        year, month = self.get_year_month()
+
+        return Event.objects.filter_calendar_grid_events(
+            user=self.request.user,
+            month=month,
+            year=year,
+        )
+
+    def list(self, request, *args, **kwargs):
+        year, month = self.get_year_month()
+        version = self.events_version
+        payload = month_cache.get(request.user.id, year, month, version, kind="grid")
+        if payload is None:
+            payload = self.get_grid(year, month)
+            month_cache.set(request.user.id, year, month, version, payload, kind="grid")
+        return Response(payload)
+
+    @staticmethod
+    def occurrence_key(item: dict) -> str:
+        return f"{item['id']}@{item['start_date']}T{item['start_time']}"
+
+    def get_grid(self, year: int, month: int) -> dict:
+        grid_start, _grid_end = grid_range_for_month(year, month)
+        occurrences = self.get_queryset()
+
+        # serialized from the occurrence, not the event it repeats
+        events = {}
+        keys = {}
+        for occurrence in occurrences:
+            item = EventReadSerializer.to_representation(occurrence)
+            key = keys[occurrence] = self.occurrence_key(item)
+            events.setdefault(key, item)
+
+        tiles = bucket_occurrences(
+            occurrences, grid_start, key=lambda occurrence: keys[occurrence]
+        )
+        first_day = grid_start.date()
+        return {
+            "tiles": [
+                {
+                    "date": (first_day + timedelta(days=index)).isoformat(),
+                    "events": event_keys,
+                }
+                for index, event_keys in enumerate(tiles)
+            ],
+            "events": events,
+        }
+
+
+class EventRangeView(
+    ConditionalGetMixin,
+    generics.GenericAPIView,
+    mixins.ListModelMixin,
+):
+    """
+    Occurrences of the user's events between ``start`` and ``end``,
+    so clients fetch exactly the range they show.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = EventWindowSerializer
+
+    def get_window(self) -> tuple[datetime, datetime]:
+        serializer = self.get_serializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data["start"], serializer.validated_data["end"]
+
+    def get_queryset(self):
+        window_start, window_end = self.get_window()
+
+        return Event.objects.filter_occurrences(
+            user=self.request.user,
+            window_start=window_start,
+            window_end=window_end,
+        )
+
+    def list(self, request, *args, **kwargs):
+        return Response(EventReadSerializer.many(self.get_queryset()))
+
+    @extend_schema(
+        tags=["events"],
+        parameters=[EventWindowSerializer],
+    )
+    def get(self, request, *args, **kwargs):
+        return self.conditional_get(self.list, request, *args, **kwargs)
+
+
+class EventDayView(EventRangeView):
+    window = staticmethod(day_window)
+
+    def get_window(self) -> tuple[datetime, datetime]:
+        try:
+            return self.window(
+                int(self.kwargs["year"]),
+                int(self.kwargs["month"]),
+                int(self.kwargs["day"]),
+            )
+        except ValueError:
+            raise NotFound("Invalid date.")
+
+    @extend_schema(
+        tags=["events"],
+    )
+    def get(self, request, *args, **kwargs):
+        return self.conditional_get(self.list, request, *args, **kwargs)
+
+
+class EventWeekView(EventDayView):
+    window = staticmethod(week_window)
+
+
+class EventStreamView(View):
+    """
+    Server-Sent Events stream telling the user's clients that their events
+    changed, so they sync (``changes/``) instead of polling. Needs the ASGI
+    entry point, every open stream is a coroutine waiting on its queue.
+
+    Browsers' EventSource can not send headers, so the access token is
+    also accepted as ``?access_token=``.
+    """
+
+    async def authenticate(self, request):
+        authenticator = AsyncJWTAuthentication()
+        header = authenticator.get_header(request)
+        if header is not None:
+            raw_token = authenticator.get_raw_token(header)
+        else:
+            raw_token = request.GET.get("access_token", "").encode() or None
+        if raw_token is None:
+            return None
+
+        try:
+            validated_token = authenticator.get_validated_token(raw_token)
+            return await authenticator.aget_user(validated_token)
+        except (InvalidToken, AuthenticationFailed):
+            return None
+
+    async def get(self, request, *args, **kwargs):
+        user = await self.authenticate(request)
+        if user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        response = StreamingHttpResponse(
+            self.stream(user.id),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # keep proxies from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, user_id: uuid.UUID):
+        # subscribed on the first read of the response, so a response that
+        # is never streamed (client gone, middleware error) leaves nothing
+        # behind, and unsubscribed however the stream ends
+        subscription = broker.subscribe(user_id)
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                message = await subscription.get(
+                    timeout=settings.EVENTS["STREAM_HEARTBEAT"]
+                )
+                if message is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"event: {message['type']}\ndata: {dumps(message)}\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+
+class AsyncAPIView(View):
+    """
+    Base of the async views. DRF's APIView only runs sync, so these plain
+    Django views authenticate with the async JWT authentication and answer
+    errors the way DRF's exception handler does.
+    """
+
+    authentication_class = AsyncJWTAuthentication
+
+    async def dispatch(self, request, *args, **kwargs):
+        authenticator = self.authentication_class()
+        try:
+            user_auth = await authenticator.aauthenticate(request)
+            if user_auth is None:
+                raise NotAuthenticated()
+            request.user, request.auth = user_auth
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as error:
+            response = self.error_response(error)
+            if response.status_code == status.HTTP_401_UNAUTHORIZED:
+                response["WWW-Authenticate"] = authenticator.authenticate_header(
+                    request
+                )
+            return response
+
+    @staticmethod
+    def error_response(error: APIException) -> HttpResponse:
+        if isinstance(error.detail, (list, dict)):
+            data = error.detail
+        else:
+            data = {"detail": error.detail}
+        return HttpResponse(
+            dumps(data),
+            content_type="application/json",
+            status=error.status_code,
+        )
+
+    @staticmethod
+    def json_response(data) -> HttpResponse:
+        return HttpResponse(dumps(data), content_type="application/json")
+
+
+class AsyncEventListView(AsyncConditionalGetMixin, AsyncAPIView):
+    """
+    ``EventListView`` on the async ORM, for the ASGI entry point.
+    A request waiting on the database holds no thread.
+    """
+
+    pagination_class = EventCursorPagination
+
+    def get_queryset(self):
+        return EventReadSerializer.rows(Event.objects.filter(user=self.request.user))
+
+    async def iter_rows(self):
+        queryset = self.get_queryset().order_by("start_datetime", "id")
+        async for row in queryset.aiterator(chunk_size=settings.EVENTS["CHUNK_SIZE"]):
+            yield row
+
+    async def list(self, request, *args, **kwargs):
+        if request.GET.get("stream") == "ndjson":
+            return StreamingHttpResponse(
+                aiter_ndjson(self.iter_rows(), EventReadSerializer.to_representation),
+                content_type="application/x-ndjson",
+            )
+
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(self.get_queryset(), Request(request))
+        if page is not None:
+            return self.json_response(
+                paginator.get_paginated_data(EventReadSerializer.many(page))
+            )
+        return self.json_response(
+            EventReadSerializer.many([row async for row in self.get_queryset()])
+        )
+
+    async def get(self, request, *args, **kwargs):
+        return await self.aconditional_get(self.list, request, *args, **kwargs)
+
+
+class AsyncEventMonthFilterListView(AsyncConditionalGetMixin, AsyncAPIView):
+    """
+    ``EventMonthFilterListView`` on the async ORM, sharing its month cache.
+    """
+
+    get_year_month = EventMonthFilterListView.get_year_month
+
+    # month payloads being read, concurrent cache misses await the same task
+    # instead of each running the query while the first one is in flight.
+    # Keyed by events version, a miss after a write does not join an older load.
+    loading: dict[tuple[uuid.UUID, int, int, int], asyncio.Task] = {}
+
+    async def load(self, user, year: int, month: int, version: int) -> list:
+        occurrences = await Event.objects.afilter_calendar_month_events(
+            user=user,
+            month=month,
+            year=year,
+        )
+        payload = EventReadSerializer.many(occurrences)
+        month_cache.set(user.id, year, month, version, payload)
+        return payload
+
+    async def list(self, request, *args, **kwargs):
+        year, month = self.get_year_month()
+        version = self.events_version
+        payload = month_cache.get(request.user.id, year, month, version)
+        if payload is None:
+            key = (request.user.id, year, month, version)
+            task = self.loading.get(key)
+            if task is None:
+                task = self.loading[key] = asyncio.ensure_future(
+                    self.load(request.user, year, month, version)
+                )
+                task.add_done_callback(lambda _task: self.loading.pop(key, None))
+            # a disconnecting client must not cancel the others' load
+            payload = await asyncio.shield(task)
+        return self.json_response(payload)
+
+    async def get(self, request, *args, **kwargs):
+        return await self.aconditional_get(self.list, request, *args, **kwargs)
@@ -1,22 +1,32 @@
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional
 
 import jwt
 from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import QuerySet
+from django.db.models import F, QuerySet
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
+from apps.auth.cache import user_cache
+
 if TYPE_CHECKING:
     from apps.users.models import User
 
 
 logger = logging.getLogger(__name__)
 
+# PBKDF2 releases the GIL, hashing on a small pool keeps a burst of logins
+# from taking every core away from the other requests
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.AUTH["PASSWORD_WORKERS"], thread_name_prefix="password"
+)
+
 
 class UserManager(BaseUserManager):
     def get_user_by_id(self, user_id: uuid.UUID) -> Optional["User"]:
@@ -59,7 +69,10 @@ class UserManager(BaseUserManager):
     def update_user(self, user_id: uuid.UUID, **kwargs) -> Optional["User"]:
         try:
             with transaction.atomic():
-                user = self.model(id=user_id)
+                user = self.get(id=user_id)
+                # only the given fields, events_version is bumped by event
+                # writes and a full save would overwrite it
+                update_fields = list(kwargs)
 
                 if "password" in kwargs:
                     user.set_password(kwargs.pop("password"))
@@ -70,7 +83,8 @@ class UserManager(BaseUserManager):
                 for key, value in kwargs.items():
                     setattr(user, key, value)
 
-                user.save()
+                user.save(update_fields=update_fields)
+                self.user_changed(user_id)
                 return user
 
         except self.model.DoesNotExist:
@@ -84,13 +98,44 @@ class UserManager(BaseUserManager):
         try:
             user = self.get(id=user_id)
             user.delete()
+            self.user_changed(user_id)
             return True
         except self.model.DoesNotExist:
             raise ValidationError("User does not exist")
 
+    @staticmethod
+    def user_changed(user_id: uuid.UUID) -> None:
+        """
+        Drop the user's cached authentications once the write commits.
+        """
+        transaction.on_commit(lambda: user_cache.invalidate_user(user_id))
+
     def update_last_login(self, user_id: uuid.UUID) -> None:
         self.filter(id=user_id).update(last_login=timezone.now())
 
+    def get_events_version(self, user_id: uuid.UUID) -> int:
+        return (
+            self.filter(id=user_id).values_list("events_version", flat=True).first()
+            or 0
+        )
+
+    async def aget_events_version(self, user_id: uuid.UUID) -> int:
+        return (
+            await self.filter(id=user_id)
+            .values_list("events_version", flat=True)
+            .afirst()
+            or 0
+        )
+
+    def bump_events_version(self, user_id: uuid.UUID) -> int:
+        """
+        Increment the user's events version and return the new value. The
+        UPDATE keeps the user row locked until the transaction ends, so a
+        user's versions commit in the order they are handed out.
+        """
+        self.filter(id=user_id).update(events_version=F("events_version") + 1)
+        return self.get_events_version(user_id)
+
     def get_all_users(self) -> QuerySet["User"]:
         return self.all()
 
@@ -104,7 +149,8 @@ class UserManager(BaseUserManager):
     ) -> Optional["User"]:
         user = self.get_user_by_id(user_id)
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=["password"])
+        self.user_changed(user_id)
 
         return user
 
@@ -116,11 +162,27 @@ class AuthManager(models.Manager):
         except self.model.DoesNotExist:
             raise ValidationError("User does not exist")
 
-        if user.check_password(password) and user.is_active:
+        if self.verify_password(user, password) and user.is_active:
             return user
 
         return None
 
+    @staticmethod
+    def verify_password(user: "User", password: str) -> bool:
+        """
+        ``User.check_password`` with the hash computed on the password pool.
+        A hash with outdated parameters is upgraded here, on the request's
+        own database connection.
+        """
+        outdated = []
+        verified = password_executor.submit(
+            check_password, password, user.password, outdated.append
+        ).result()
+        if verified and outdated:
+            user.set_password(password)
+            user.save(update_fields=["password"])
+        return verified
+
     @staticmethod
     def decode_token(token: AccessToken | RefreshToken) -> Optional[dict[str, any]]:
         try:
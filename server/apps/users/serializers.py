@@ -36,10 +36,12 @@ class UserSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data) -> "User":
         user = User.objects.update_user(
             user_id=instance.id,
-            email=validated_data.get("email", instance.email),
-            first_name=validated_data.get("first_name", instance.first_name),
-            last_name=validated_data.get("last_name", instance.last_name),
-            **validated_data,
+            **{
+                "email": instance.email,
+                "first_name": instance.first_name,
+                "last_name": instance.last_name,
+                **validated_data,
+            },
         )
         return user
 
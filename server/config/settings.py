@@ -168,7 +168,7 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.auth.authentication.CachedJWTAuthentication",
     ],
     "NON_FIELD_ERRORS_KEY": "errors",
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
@@ -189,3 +189,52 @@ SIMPLE_JWT = {
     "UPDATE_LAST_LOGIN": False,
     "ALGORITHM": os.getenv("TOKEN_ALGORITHM"),
 }
+
+EVENTS = {
+    # upper bound of a single event span, lets overlap queries seek on start
+    "MAX_DURATION": timedelta(days=31),
+    # materialized occurrences are kept for [now - HISTORY, now + HORIZON)
+    "OCCURRENCE_HISTORY": timedelta(days=90),
+    "OCCURRENCE_HORIZON": timedelta(days=365),
+    # rows per round trip for bulk writes and streamed reads
+    "CHUNK_SIZE": 2000,
+    # default and upper bound of ?page_size= for the events list
+    "PAGE_SIZE": 100,
+    "MAX_PAGE_SIZE": 1000,
+    # upper bound of events in one bulk request
+    "MAX_BULK_SIZE": 1000,
+    # serialized month payloads kept in memory per process
+    "MONTH_CACHE_SIZE": 4096,
+    # upper bound of the window of range and free/busy queries
+    "MAX_WINDOW": timedelta(days=62),
+    # upper bound of users in one free/busy query
+    "MAX_FREEBUSY_USERS": 100,
+    # upper bound of slots returned by the slot finder
+    "MAX_SLOTS": 50,
+    # upper bound of ?limit= for full-text search
+    "MAX_SEARCH_RESULTS": 100,
+    # users whose event name autocomplete index is kept in memory per process
+    "AUTOCOMPLETE_USERS": 1024,
+    # tombstones are pruned after this, older tokens get a full resync
+    "TOMBSTONE_RETENTION": timedelta(days=90),
+    # fan-out of change notifications, swap for a cross-worker backend
+    "PUBSUB_BACKEND": "apps.events.pubsub.LocalBackend",
+    # pending notifications per connected client before it is told to resync
+    "STREAM_QUEUE_SIZE": 100,
+    # seconds between keep-alive comments on idle event streams
+    "STREAM_HEARTBEAT": 15,
+}
+
+AUTH = {
+    # authenticated users kept in process, keyed by user and token
+    "USER_CACHE_SIZE": 4096,
+    # seconds before a cached user is read again
+    "USER_CACHE_TTL": 300,
+    # threads hashing login passwords, caps the cores a login burst can take
+    "PASSWORD_WORKERS": 2,
+}
+
+BATCH = {
+    # sub-requests accepted in one batch request
+    "MAX_REQUESTS": 20,
+}
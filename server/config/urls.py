@@ -37,4 +37,9 @@ urlpatterns = [
         include("apps.events.urls"),
         name="api-events",
     ),
+    re_path(
+        r"^(?P<version>(v1|v2))/batch/",
+        include("apps.batch.urls"),
+        name="api-batch",
+    ),
 ]
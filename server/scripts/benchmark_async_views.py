@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from wsgiref.util import setup_testing_defaults
+
+from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from django.db import connection
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.events.cache import month_cache
+from apps.events.enums import RecurringType
+from apps.events.models import Event
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+EMAIL = "benchmark-async@example.com"
+HOST = "localhost"
+
+
+def measure(latencies: list[float], seconds: float) -> str:
+    latencies = sorted(latencies)
+    percentile = lambda share: latencies[int(share * (len(latencies) - 1))]  # noqa: E731
+    return (
+        f"{len(latencies) / seconds:>8.0f} req/s  "
+        f"p50 {percentile(0.5) * 1000:>7.0f}ms  "
+        f"p95 {percentile(0.95) * 1000:>7.0f}ms  "
+        f"max {latencies[-1] * 1000:>7.0f}ms  "
+        f"mean {statistics.fmean(latencies) * 1000:>7.0f}ms"
+    )
+
+
+def run_wsgi(path: str, token: str, requests: int, threads: int) -> str:
+    """
+    One WSGI worker with a pool of ``threads`` threads, all ``requests``
+    submitted at once, so the rest wait for a free thread.
+    """
+    application = get_wsgi_application()
+
+    def request(submitted: float) -> float:
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path.partition("?")[0],
+            "QUERY_STRING": path.partition("?")[2],
+            "HTTP_HOST": HOST,
+            "HTTP_AUTHORIZATION": f"Bearer {token}",
+        }
+        setup_testing_defaults(environ)
+        statuses = []
+        body = application(environ, lambda status, headers: statuses.append(status))
+        try:
+            for _chunk in body:
+                pass
+        finally:
+            body.close()
+        if not statuses[0].startswith("200"):
+            raise AssertionError(f"GET {path} answered {statuses[0]}.")
+        return time.perf_counter() - submitted
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        futures = [executor.submit(request, started) for _ in range(requests)]
+        latencies = [future.result() for future in futures]
+        return measure(latencies, time.perf_counter() - started)
+
+
+def run_asgi(path: str, token: str, requests: int) -> str:
+    """
+    One ASGI event loop with ``requests`` connections open at once.
+    """
+    application = get_asgi_application()
+    path, _, query_string = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": [
+            (b"host", HOST.encode()),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": (HOST, 80),
+    }
+
+    async def request(started: float) -> float:
+        done = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        statuses = []
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # the client stays connected until the response is complete
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+            elif not message.get("more_body", False):
+                done.set()
+
+        await application(dict(scope), receive, send)
+        if statuses[0] != 200:
+            raise AssertionError(f"GET {path} answered {statuses[0]}.")
+        return time.perf_counter() - started
+
+    async def main() -> str:
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(request(started) for _ in range(requests)))
+        return measure(latencies, time.perf_counter() - started)
+
+    return asyncio.run(main())
+
+
+def create_user(events: int) -> User:
+    """
+    A committed user with ``events`` events, the ASGI requests read the
+    database from another thread and can not see an open transaction.
+    """
+    user = User.objects.create_user(email=EMAIL, password=None)
+    start = timezone.now().replace(day=1, hour=8, minute=0, second=0, microsecond=0)
+    types = RecurringType.values()
+    Event.objects.bulk_create(
+        [
+            Event(
+                user=user,
+                name=f"Event {index}",
+                description=f"Benchmark event number {index}.",
+                recurring_type=types[index % len(types)],
+                start_datetime=start + timedelta(hours=index),
+                end_datetime=start + timedelta(hours=index, minutes=30),
+            )
+            for index in range(events)
+        ],
+        batch_size=5000,
+    )
+    return user
+
+
+def run(*args):
+    """
+    Compare the sync views under WSGI with the async views under ASGI,
+    in process, with every request in flight at once.
+
+    The WSGI worker serves ``threads`` requests at a time and queues the
+    rest. The ASGI worker keeps every connection open as a coroutine,
+    its cost per waiting request is a task instead of a thread. With
+    SQLite, Django runs the async ORM queries on one shared thread, so
+    throughput stays bound by the database; what the async views buy is
+    concurrency (open connections per worker), not faster queries.
+
+    The data lives in a throwaway test database created for the run, the
+    configured database is not touched. The responses themselves are
+    checked in apps.events.tests.test_async_views.
+
+    uv run python manage.py runscript benchmark_async_views
+    uv run python manage.py runscript benchmark_async_views --script-args requests=500 threads=32 events=200 cache=off
+    """
+    _requests = 500
+    _threads = 32
+    _events = 200
+    _cache = True
+
+    for arg in args:
+        if arg.startswith("requests="):
+            _requests = int(arg.split("=", 1)[1])
+        elif arg.startswith("threads="):
+            _threads = int(arg.split("=", 1)[1])
+        elif arg.startswith("events="):
+            _events = int(arg.split("=", 1)[1])
+        elif arg.startswith("cache="):
+            _cache = arg.split("=", 1)[1] != "off"
+
+    # with SQLite an in-memory database shared by the worker threads
+    database_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False
+    )
+    maxsize = month_cache.cache.maxsize
+    try:
+        user = create_user(_events)
+        token = str(AccessToken.for_user(user))
+        today = timezone.localdate()
+        if not _cache:
+            # month payloads are not kept between requests
+            month_cache.cache.maxsize = 0
+
+        views = [
+            ("month", f"/v1/events/{today.year}/{today.month}/"),
+            ("list", "/v1/events/?page_size=100"),
+        ]
+        logger.info(
+            f"{_requests} concurrent requests, {_events} events, "
+            f"month cache {'on' if _cache else 'off'}"
+        )
+        for name, path in views:
+            async_path = path.replace("/events/", "/events/async/", 1)
+            month_cache.invalidate_user(user.id)
+            logger.info(
+                f"{name:>6} wsgi x{_threads:<4} {run_wsgi(path, token, _requests, _threads)}"
+            )
+            month_cache.invalidate_user(user.id)
+            logger.info(
+                f"{name:>6} asgi       {run_asgi(async_path, token, _requests)}"
+            )
+    finally:
+        month_cache.cache.maxsize = maxsize
+        month_cache.cache.clear()
+        connection.creation.destroy_test_db(database_name, verbosity=0)
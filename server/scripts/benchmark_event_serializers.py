@@ -0,0 +1,80 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.events.enums import RecurringType
+from apps.events.models import Event
+from apps.events.serializers import EventReadSerializer, EventSerializer
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+class Rollback(Exception):
+    pass
+
+
+def run(*args):
+    """
+    Compare EventSerializer with EventReadSerializer on 1k, 10k and 100k
+    events. Events are created inside a transaction that is rolled back.
+    The outputs are compared too, as in apps.events.tests.test_serializers.
+
+    uv run python manage.py runscript benchmark_event_serializers
+    uv run python manage.py runscript benchmark_event_serializers --script-args 5000
+    """
+    sizes = tuple(int(arg) for arg in args) or SIZES
+    renderer = JSONRenderer()
+
+    def measure(function) -> tuple[float, bytes]:
+        started = time.perf_counter()
+        content = renderer.render(function())
+        return time.perf_counter() - started, content
+
+    logger.info(f"{'events':>8} {'model':>10} {'fast':>10} {'speedup':>8}")
+    for size in sizes:
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=f"benchmark-{size}@example.com", password=None
+                )
+                start = timezone.now()
+                types = RecurringType.values()
+                Event.objects.bulk_create(
+                    [
+                        Event(
+                            user=user,
+                            name=f"Event {index}",
+                            description=f"Benchmark event number {index}.",
+                            recurring_type=types[index % len(types)],
+                            start_datetime=start + timedelta(minutes=index),
+                            end_datetime=start + timedelta(minutes=index + 30),
+                        )
+                        for index in range(size)
+                    ],
+                    batch_size=5000,
+                )
+                queryset = Event.objects.filter(user=user).order_by("start_datetime")
+
+                model_time, model_content = measure(
+                    lambda: EventSerializer(queryset, many=True).data
+                )
+                fast_time, fast_content = measure(
+                    lambda: EventReadSerializer.many(EventReadSerializer.rows(queryset))
+                )
+                if model_content != fast_content:
+                    raise AssertionError(f"Outputs differ for {size} events.")
+
+                logger.info(
+                    f"{size:>8} {model_time:>9.3f}s {fast_time:>9.3f}s "
+                    f"{model_time / fast_time:>7.1f}x"
+                )
+                raise Rollback
+        except Rollback:
+            pass
@@ -0,0 +1,53 @@
+import logging
+
+from django.utils import timezone
+
+from apps.events.models import EVENT_TIME_INDEXES, Event
+from apps.events.utils import grid_range_for_month
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+def run(*args):
+    """
+    Check with EXPLAIN QUERY PLAN that the calendar lookups seek on a
+    per-user time index instead of scanning the events table.
+    The same check runs in apps.events.tests.test_query_plans.
+    """
+    user = User.objects.first()
+    if user is None:
+        raise SystemExit("Create at least one user first (see generate_users).")
+
+    today = timezone.localdate()
+    window_start, window_end = grid_range_for_month(today.year, today.month)
+
+    queries = {
+        "overlap": Event.objects.filter_overlapping(
+            user=user,
+            window_start=window_start,
+            window_end=window_end,
+        ),
+        "month": Event.objects.filter(
+            user=user,
+            start_datetime__lt=window_end,
+        ),
+    }
+
+    failed = False
+    for label, queryset in queries.items():
+        plan = queryset.explain()
+        uses_index = (
+            any(f"INDEX {name} " in plan for name in EVENT_TIME_INDEXES)
+            and "(user_id=? AND start_datetime" in plan
+        )
+        if uses_index:
+            logger.info(f"[ok] {label}: {plan}")
+        else:
+            logger.error(f"[FAIL] {label}: {plan}")
+        failed = failed or not uses_index
+
+    if failed:
+        raise SystemExit(
+            f"Query plan does not seek on {' or '.join(EVENT_TIME_INDEXES)}."
+        )
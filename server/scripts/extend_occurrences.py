@@ -0,0 +1,16 @@
+import logging
+
+from apps.events.models import EventOccurrence, EventTombstone
+
+logger = logging.getLogger(__name__)
+
+
+def run(*args):
+    """
+    Move the materialized occurrence horizon forward and prune
+    expired delete tombstones.
+    Meant to be run periodically (e.g. daily from cron).
+    """
+    horizon = EventOccurrence.objects.extend_horizon()
+    logger.info(f"Occurrences materialized for {horizon}")
+    EventTombstone.objects.prune()
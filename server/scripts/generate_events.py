@@ -1,8 +1,10 @@
 import argparse
 import logging
+from collections import defaultdict
 from datetime import timedelta
 from random import choice, choices, randint
 
+from django.conf import settings
 from django.db.models import QuerySet
 from django.utils import timezone
 from dotenv import load_dotenv
@@ -25,33 +27,44 @@ fake = Faker()
 def run(*args):
     def generate_events_list(
         users_list: QuerySet["User"], limit: int = 100
-    ) -> list["Event"]:
-        _events = []
+    ) -> dict["User", list[dict]]:
+        _events = defaultdict(list)
         selected_users = choices(users_list, k=limit)
 
         for user in selected_users:
-            start_datetime = fake.date_between(start_date="-126d", end_date="+126d")
-            end_datetime = fake.date_between(start_date="-126d", end_date="+126d")
-            while start_datetime > end_datetime:
-                end_datetime = fake.date_between(start_date="-126d", end_date="+126d")
-
-            _events.append(
-                Event(
-                    user=user,
-                    name=fake.unique.name(),
-                    description=fake.text(),
-                    recurring_type=str(choice(RecurringType.choices())[0]),
-                    start_datetime=start_datetime,
-                    end_datetime=end_datetime,
-                )
+            start_datetime = fake.date_time_between(
+                start_date="-126d",
+                end_date="+126d",
+                tzinfo=timezone.get_current_timezone(),
+            )
+            end_datetime = fake.date_time_between(
+                start_date=start_datetime,
+                end_date=start_datetime + settings.EVENTS["MAX_DURATION"],
+                tzinfo=timezone.get_current_timezone(),
+            )
+
+            _events[user].append(
+                {
+                    "name": fake.unique.name(),
+                    "description": fake.text(),
+                    "recurring_type": str(choice(RecurringType.choices())[0]),
+                    "start_datetime": start_datetime,
+                    "end_datetime": end_datetime,
+                }
             )
 
         return _events
 
     def generate_events(users_list: QuerySet["User"], limit: int = 100) -> None:
-        events = generate_events_list(users_list=users_list, limit=limit)
-        Event.objects.bulk_create(events)
-        logger.info(f"Created {len(events)} events")
+        created = 0
+        for user, items in generate_events_list(users_list, limit).items():
+            # through the manager, so the occurrences are materialized and
+            # the change number and cached months follow the new events
+            events, errors = Event.objects.bulk_create_events(user, items)
+            created += len(events)
+            if errors:
+                logger.warning(f"Skipped {len(errors)} events of user {user.id}")
+        logger.info(f"Created {created} events")
 
     users = User.objects.all()
     _limit = int(args[0]) if len(args) > 0 else 100
@@ -0,0 +1,56 @@
+import logging
+from time import perf_counter
+
+from dotenv import load_dotenv
+
+from apps.events.importers import csv_records, ics_records, import_events
+from apps.users.models import User
+from config.paths import PROJECT_DIR
+
+load_dotenv(
+    dotenv_path=PROJECT_DIR / ".env.local",
+)
+logger = logging.getLogger(__name__)
+
+
+def run(*args):
+    _email = None
+    _path = None
+    _batch = None
+
+    for arg in args:
+        if arg.startswith("email="):
+            _email = arg.split("=", 1)[1]
+        elif arg.startswith("path="):
+            _path = arg.split("=", 1)[1]
+        elif arg.startswith("batch="):
+            _batch = int(arg.split("=", 1)[1])
+
+    if not _email or not _path:
+        logger.error("Usage: --script-args email=<user email> path=<file.ics|file.csv>")
+        return
+
+    user = User.objects.get_user_by_email(_email)
+    if user is None:
+        logger.error(f"User {_email} not found.")
+        return
+
+    parse = ics_records if _path.lower().endswith(".ics") else csv_records
+    created = failed = 0
+    started = perf_counter()
+    with open(_path, encoding="utf-8-sig", newline="") as file:
+        for batch in import_events(user, parse(file), batch_size=_batch):
+            created += batch.created
+            failed += len(batch.errors)
+            logger.info(
+                f"batch {batch.number}: {batch.created} created, "
+                f"{len(batch.errors)} failed, {batch.events_per_second:.0f} events/s"
+            )
+            for line, message in batch.errors.items():
+                logger.warning(f"{_path}:{line}: {message}")
+
+    seconds = perf_counter() - started
+    logger.info(
+        f"{created} events created, {failed} failed in {seconds:.2f}s "
+        f"({created / seconds if seconds else 0:.0f} events/s)"
+    )